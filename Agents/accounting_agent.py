@@ -14,6 +14,8 @@ Capabilities:
 
 Requirements:
     pip install requests
+    pip install orjson  # optional, faster JSON-RPC encode/decode
+    pip install watchdog  # optional, event-driven Needs_Action monitoring
 
 Usage:
     python accounting_agent.py
@@ -27,11 +29,29 @@ import sys
 import re
 import json
 import logging
+import tempfile
+import threading
 import requests
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Tuple
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -43,6 +63,99 @@ logging.basicConfig(
 logger = logging.getLogger("OdooAccountingAgent")
 
 
+def _json_dumps(payload: Any) -> bytes:
+    """Encode a JSON-RPC payload, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON-RPC response body, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_umask_lock = threading.Lock()
+
+
+def _current_umask() -> int:
+    """
+    Return the process umask.
+    
+    Read from /proc/self/status where available (Linux 4.7+). Elsewhere
+    os.umask has to set a value to return the old one; the swap is
+    serialised, but files other threads create in that instant get 0o022.
+    """
+    try:
+        with open('/proc/self/status', 'rb') as f:
+            for line in f:
+                if line.startswith(b'Umask:'):
+                    return int(line.split()[1], 8)
+    except (OSError, ValueError, IndexError):
+        pass
+    with _umask_lock:
+        umask = os.umask(0o022)
+        os.umask(umask)
+    return umask
+
+
+def _atomic_write(path: Path, data: str):
+    """Write text to path via a temp file + os.replace so readers never see a partial file."""
+    tmp = tempfile.NamedTemporaryFile('w', dir=path.parent, delete=False,
+                                      encoding='utf-8', suffix='.tmp')
+    try:
+        with tmp:
+            tmp.write(data)
+            tmp.flush()
+            os.fsync(tmp.fileno())
+        # Temp files are created 0600: keep an existing file's permissions,
+        # and give a new file the mode open() would have used
+        try:
+            mode = path.stat().st_mode & 0o777
+        except FileNotFoundError:
+            mode = 0o666 & ~_current_umask()
+        os.chmod(tmp.name, mode)
+        os.replace(tmp.name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp.name)
+        except OSError:
+            pass
+        raise
+
+
+# Patterns used on every scanned task file
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+_FM_KV_RE = re.compile(r'^([^:\n]*):(.*)$', re.MULTILINE)
+_STATUS_RE = re.compile(r'(status:\s*)[^\n]+', re.MULTILINE)
+_STATUS_DONE_RE = re.compile(r'(status:\s*done)')
+_AMOUNT_RE = re.compile(r'\$?([\d,]+\.?\d*)')
+# Result sections update_task_file appends once a task has been executed
+_RESULT_SECTION_RE = re.compile(
+    r'^## (?:Invoice Created|Summary Generated|Task Completed|Task Failed)$', re.MULTILINE
+)
+
+# Accounting task indicators: any single keyword, or both words of a pair
+_ACCT_KEYWORDS = (
+    'skill: odoo_accounting', 'skill:odoo_accounting',
+    'skill: accounting', 'skill:accounting',
+    'balance',
+)
+_ACCT_KEYWORD_PAIRS = (
+    ('invoice', 'create'),
+    ('financial', 'summary'),
+)
+
+
+def _is_accounting_task(content: str) -> bool:
+    """Check task content for accounting indicators with a single lower() copy."""
+    lowered = content.lower()
+    return (any(kw in lowered for kw in _ACCT_KEYWORDS) or
+            any(a in lowered and b in lowered for a, b in _ACCT_KEYWORD_PAIRS))
+
+
 class OdooConnector:
     """JSON-RPC connector for Odoo Community."""
     
@@ -53,6 +166,28 @@ class OdooConnector:
         self.api_key = config['api_key']
         self.uid = None
         self.connected = False
+        # Whether the server accepts JSON-RPC batches; probed on first use
+        self._batch_ok: Optional[bool] = None
+        
+        # Keep-alive session so repeated JSON-RPC calls reuse one connection
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.2)
+        )
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'Content-Type': 'application/json',
+            'Connection': 'keep-alive'
+        })
+    
+    def close(self):
+        """Close the underlying HTTP session."""
+        self.session.close()
+        self.connected = False
+        self._batch_ok = None
     
     def authenticate(self) -> bool:
         """Authenticate with Odoo via JSON-RPC."""
@@ -68,8 +203,8 @@ class OdooConnector:
                 "id": 1
             }
             
-            response = requests.post(self.url, json=payload, timeout=10)
-            result = response.json()
+            response = self.session.post(self.url, data=_json_dumps(payload), timeout=10)
+            result = _json_loads(response.content)
             
             if 'result' in result and result['result']:
                 self.uid = result['result']
@@ -84,13 +219,10 @@ class OdooConnector:
             logger.error(f"Connection failed: {e}")
             return False
     
-    def execute(self, model: str, method: str, args: Optional[List] = None, 
-                kwargs: Optional[Dict] = None) -> Any:
-        """Execute Odoo model method."""
-        if not self.connected:
-            raise Exception("Not connected to Odoo")
-        
-        payload = {
+    def _build_call(self, model: str, method: str, args: Optional[List] = None,
+                    kwargs: Optional[Dict] = None, request_id: int = 2) -> Dict:
+        """Build an execute_kw JSON-RPC payload."""
+        return {
             "jsonrpc": "2.0",
             "method": "call",
             "params": {
@@ -106,22 +238,95 @@ class OdooConnector:
                     kwargs or {}
                 ]
             },
-            "id": 2
+            "id": request_id
         }
+    
+    @staticmethod
+    def _unwrap(result: Dict) -> Any:
+        """Return the result of a JSON-RPC response or raise its error."""
+        if 'result' in result:
+            return result['result']
+        error = result.get('error', {})
+        raise Exception(f"Odoo error: {error.get('data', {}).get('message', error.get('message', 'Unknown error'))}")
+    
+    def execute(self, model: str, method: str, args: Optional[List] = None, 
+                kwargs: Optional[Dict] = None) -> Any:
+        """Execute Odoo model method."""
+        if not self.connected:
+            raise Exception("Not connected to Odoo")
+        
+        payload = self._build_call(model, method, args, kwargs)
         
         try:
-            response = requests.post(self.url, json=payload, timeout=30)
-            result = response.json()
-            
-            if 'result' in result:
-                return result['result']
-            else:
-                error = result.get('error', {})
-                raise Exception(f"Odoo error: {error.get('data', {}).get('message', error.get('message', 'Unknown error'))}")
+            response = self.session.post(self.url, data=_json_dumps(payload), timeout=30)
+            return self._unwrap(_json_loads(response.content))
                 
         except requests.exceptions.RequestException as e:
             raise Exception(f"Request failed: {e}")
     
+    def supports_batch(self) -> bool:
+        """
+        Check once per connection whether the server accepts JSON-RPC batches.
+        
+        Stock Odoo's /jsonrpc endpoint handles one request object per POST
+        and rejects an array, so batching needs a proxy or server module
+        that adds it. The probe is a batch holding the side-effect free
+        common.version call; any answer but a one-element array means no.
+        """
+        if self._batch_ok is None:
+            payload = [{
+                "jsonrpc": "2.0",
+                "method": "call",
+                "params": {"service": "common", "method": "version", "args": []},
+                "id": 0
+            }]
+            try:
+                response = self.session.post(self.url, data=_json_dumps(payload), timeout=10)
+            except requests.exceptions.RequestException as e:
+                raise Exception(f"Request failed: {e}")
+            try:
+                result = _json_loads(response.content)
+            except ValueError:
+                result = None
+            self._batch_ok = (isinstance(result, list) and len(result) == 1
+                              and 'result' in result[0])
+            logger.info(f"Odoo JSON-RPC batch support: {'yes' if self._batch_ok else 'no'}")
+        return self._batch_ok
+    
+    def execute_batch(self, calls: List[Tuple[str, str, Optional[List], Optional[Dict]]]) -> List[Any]:
+        """
+        Execute several independent model methods in one JSON-RPC batch.
+        
+        Results are returned in the same order as ``calls``. On servers
+        without batch support (stock Odoo) the calls are made one by one
+        with execute(), without sending a batch first. A batch is never
+        resent: transport, decode and malformed-reply errors are raised.
+        """
+        if not self.connected:
+            raise Exception("Not connected to Odoo")
+        
+        if not self.supports_batch():
+            return [self.execute(*call) for call in calls]
+        
+        payload = [
+            self._build_call(model, method, args, kwargs, request_id=i)
+            for i, (model, method, args, kwargs) in enumerate(calls)
+        ]
+        
+        try:
+            response = self.session.post(self.url, data=_json_dumps(payload), timeout=30)
+        except requests.exceptions.RequestException as e:
+            raise Exception(f"Request failed: {e}")
+        result = _json_loads(response.content)
+        
+        if not isinstance(result, list) or len(result) != len(calls):
+            if isinstance(result, dict):
+                self._unwrap(result)
+            raise Exception("Odoo error: malformed batch response")
+        
+        by_id = {r.get('id'): r for r in result}
+        return [self._unwrap(by_id.get(i, {})) for i in range(len(calls))]
+    
     def search_read(self, model: str, domain: Optional[List] = None, 
                     fields: Optional[List] = None, limit: int = 100) -> List[Dict]:
         """Search and read records from Odoo."""
@@ -130,6 +335,21 @@ class OdooConnector:
                            kwargs={'limit': limit})
 
 
+class _TaskDirHandler(FileSystemEventHandler):
+    """Wakes the agent loop when a markdown task file changes."""
+    
+    def __init__(self, wake: threading.Event):
+        super().__init__()
+        self.wake = wake
+    
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        paths = (event.src_path, getattr(event, 'dest_path', ''))
+        if any(str(p).lower().endswith('.md') for p in paths):
+            self.wake.set()
+
+
 class OdooAccountingAgent:
     """
     Odoo Accounting Agent - Business accounting via Odoo ERP.
@@ -140,6 +360,11 @@ class OdooAccountingAgent:
     MCP_PORT = int(os.getenv("ACCOUNTING_MCP_PORT", "8767"))
     MCP_URL = f"http://{MCP_HOST}:{MCP_PORT}"
     
+    # Upper bound on the mtime cache of non-accounting files. An evicted
+    # file is only re-read; executed tasks (processed_tasks) are never
+    # evicted while their file is in Needs_Action.
+    MAX_SEEN_TASKS = 4096
+    
     def __init__(self, needs_action_dir: Path, logs_dir: Path, mcp_dir: Optional[Path] = None):
         self.needs_action_dir = needs_action_dir
         self.logs_dir = logs_dir
@@ -147,7 +372,23 @@ class OdooAccountingAgent:
         
         self.odoo: Optional[OdooConnector] = None
         self.config: Optional[Dict] = None
+        # Names of executed accounting tasks still in Needs_Action. Actions
+        # such as invoice creation are not idempotent, so an executed task is
+        # never run again, even if its file is modified. Entries are dropped
+        # once the file leaves the directory; a file that comes back is
+        # recognised by the result section update_task_file wrote into it.
         self.processed_tasks: set = set()
+        # Non-accounting filename -> mtime (ns) when last read, so unchanged
+        # files are not re-read; pruned like processed_tasks and kept as a
+        # bounded LRU
+        self._seen: "OrderedDict[str, int]" = OrderedDict()
+        
+        # Set by the watchdog handler when Needs_Action changes
+        self._wake = threading.Event()
+        
+        # Lookup caches for values that rarely change between invoices
+        self._journal_cache: Optional[int] = None
+        self._partner_cache: Dict[Tuple[str, str], int] = {}
         
         # Accounting directory for reports
         self.accounting_dir = self.logs_dir / "Accounting"
@@ -190,13 +431,21 @@ class OdooAccountingAgent:
         if not self.config:
             logger.warning("No Odoo configuration - using demo mode")
             return False
-        
+
+        # Reuse the live connector (and its keep-alive session)
+        if self.odoo and self.odoo.connected:
+            return True
+
+        if self.odoo:
+            self.odoo.close()
         self.odoo = OdooConnector(self.config)
         
         if self.odoo.authenticate():
             logger.info("Connected to Odoo successfully")
             return True
         
+        self._journal_cache = None
+        self._partner_cache.clear()
         logger.warning("Failed to connect to Odoo - using demo mode")
         return False
     
@@ -205,16 +454,19 @@ class OdooAccountingAgent:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
+        return self.parse_task(content)
+    
+    def parse_task(self, content: str) -> Tuple[str, Dict]:
+        """Split already-read task content into body + frontmatter."""
         frontmatter = {}
         body = content
         
-        frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+        frontmatter_match = _FRONTMATTER_RE.match(content)
         if frontmatter_match:
-            fm_text = frontmatter_match.group(1)
-            for line in fm_text.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
-                    frontmatter[key.strip()] = value.strip()
+            frontmatter = {
+                key.strip(): value.strip()
+                for key, value in _FM_KV_RE.findall(frontmatter_match.group(1))
+            }
             body = content[frontmatter_match.end():]
         
         return body, frontmatter
@@ -259,18 +511,31 @@ class OdooAccountingAgent:
                 })]
             }
             
-            invoice_id = self.odoo.execute('account.move', 'create', args=[invoice_data])
+            # Settle batch support before anything is created, so the
+            # one-time probe cannot fail between creating and posting
+            self.odoo.supports_batch()
             
-            # Post invoice
-            self.odoo.execute('account.move', 'action_post', args=[[invoice_id]])
+            invoice_id = self.odoo.execute('account.move', 'create', args=[invoice_data])
             
-            # Read invoice details
-            invoice = self.odoo.search_read(
-                'account.move',
-                domain=[['id', '=', invoice_id]],
-                fields=['name', 'partner_id', 'amount_total', 'state', 'invoice_date', 'invoice_date_due'],
-                limit=1
-            )
+            # Post invoice and read its details by id: one round-trip with
+            # batch support, two plain calls on stock Odoo. Nothing is
+            # resent, so after a timeout the invoice may already be posted;
+            # report its id rather than a bare failure so it is checked in
+            # Odoo instead of being created again.
+            try:
+                _, invoice = self.odoo.execute_batch([
+                    ('account.move', 'action_post', [[invoice_id]], {}),
+                    ('account.move', 'read',
+                     [[invoice_id], ['name', 'partner_id', 'amount_total', 'state', 'invoice_date', 'invoice_date_due']], {}),
+                ])
+            except Exception as e:
+                logger.error(f"Invoice {invoice_id} created but posting it failed: {e}")
+                return {
+                    'success': False,
+                    'invoice_id': invoice_id,
+                    'error': f"Invoice {invoice_id} was created but posting it failed "
+                             f"(it may already be posted - check Odoo before retrying): {e}"
+                }
             
             if invoice:
                 inv = invoice[0]
@@ -295,6 +560,16 @@ class OdooAccountingAgent:
     
     def _find_or_create_partner(self, name: str, email: str = '') -> int:
         """Find existing partner or create new one."""
+        cache_key = (name.lower(), email.lower())
+        if cache_key in self._partner_cache:
+            return self._partner_cache[cache_key]
+        
+        partner_id = self._lookup_or_create_partner(name, email)
+        self._partner_cache[cache_key] = partner_id
+        return partner_id
+    
+    def _lookup_or_create_partner(self, name: str, email: str) -> int:
+        """Search Odoo for a partner by email, then name, creating it if missing."""
         # Search for existing partner
         if email:
             partners = self.odoo.search_read(
@@ -326,6 +601,12 @@ class OdooAccountingAgent:
     
     def _get_sales_journal(self) -> int:
         """Get sales journal ID."""
+        if self._journal_cache is None:
+            self._journal_cache = self._lookup_sales_journal()
+        return self._journal_cache
+    
+    def _lookup_sales_journal(self) -> int:
+        """Query Odoo for the sales journal ID."""
         journals = self.odoo.search_read(
             'account.journal',
             domain=[['type', '=', 'sale']],
@@ -342,8 +623,15 @@ class OdooAccountingAgent:
     
     def read_transactions(self, date_from: Optional[str] = None, 
                           date_to: Optional[str] = None,
-                          limit: int = 50) -> Dict:
-        """Read account transactions from Odoo."""
+                          limit: int = 50,
+                          fields: Optional[List[str]] = None) -> Dict:
+        """
+        Read account transactions from Odoo.
+        
+        ``fields`` narrows the account.move columns requested; Odoo always
+        returns ``id``, and columns that are not requested are left out of
+        the formatted transactions.
+        """
         if not self.odoo or not self.odoo.connected:
             # Demo mode
             logger.info("[DEMO] Would fetch transactions")
@@ -369,7 +657,7 @@ class OdooAccountingAgent:
             transactions = self.odoo.search_read(
                 'account.move',
                 domain=domain,
-                fields=['id', 'name', 'date', 'move_type', 'amount_total', 'state', 'partner_id'],
+                fields=fields or ['id', 'name', 'date', 'move_type', 'amount_total', 'state', 'partner_id'],
                 limit=limit
             )
             
@@ -378,11 +666,11 @@ class OdooAccountingAgent:
             for t in transactions:
                 formatted.append({
                     'id': t['id'],
-                    'name': t['name'],
-                    'date': t['date'],
-                    'type': t['move_type'],
-                    'amount': t['amount_total'],
-                    'state': t['state'],
+                    'name': t.get('name', ''),
+                    'date': t.get('date', ''),
+                    'type': t.get('move_type', ''),
+                    'amount': t.get('amount_total', 0),
+                    'state': t.get('state', ''),
                     'partner': t['partner_id'][1] if t.get('partner_id') else ''
                 })
             
@@ -412,32 +700,23 @@ class OdooAccountingAgent:
             }
         
         try:
-            # Get account types
-            balances = {}
-            
-            # Accounts Receivable
-            ar_accounts = self.odoo.search_read(
-                'account.account',
-                domain=[['account_type', '=', 'asset_receivable']],
-                fields=['id', 'name', 'balance']
-            )
-            balances['accounts_receivable'] = sum(a.get('balance', 0) for a in ar_accounts)
-            
-            # Accounts Payable
-            ap_accounts = self.odoo.search_read(
-                'account.account',
-                domain=[['account_type', '=', 'liability_payable']],
-                fields=['id', 'name', 'balance']
-            )
-            balances['accounts_payable'] = sum(a.get('balance', 0) for a in ap_accounts)
+            # Receivable, payable and bank balances in a single round-trip
+            # where the server supports JSON-RPC batches, else three calls
+            account_types = [
+                ('accounts_receivable', 'asset_receivable'),
+                ('accounts_payable', 'liability_payable'),
+                ('bank', 'asset_cash'),
+            ]
+            results = self.odoo.execute_batch([
+                ('account.account', 'search_read',
+                 [[['account_type', '=', account_type]], ['balance']], {})
+                for _, account_type in account_types
+            ])
             
-            # Bank accounts
-            bank_accounts = self.odoo.search_read(
-                'account.account',
-                domain=[['account_type', '=', 'asset_cash']],
-                fields=['id', 'name', 'balance']
-            )
-            balances['bank'] = sum(a.get('balance', 0) for a in bank_accounts)
+            balances = {
+                key: sum(a.get('balance', 0) for a in accounts)
+                for (key, _), accounts in zip(account_types, results)
+            }
             
             # Net calculation
             balances['net'] = balances['bank'] + balances['accounts_receivable'] - balances['accounts_payable']
@@ -459,25 +738,46 @@ class OdooAccountingAgent:
             week_start = today - timedelta(days=today.weekday())
             week_end = week_start + timedelta(days=6)
             
-            # Fetch transactions for the week
-            transactions_result = self.read_transactions(
-                date_from=week_start.strftime('%Y-%m-%d'),
-                date_to=week_end.strftime('%Y-%m-%d'),
-                limit=200
-            )
+            summary_file = self.accounting_dir / f"weekly_financial_summary_{week_start.strftime('%Y%m%d')}.md"
+            cache_file = summary_file.with_suffix('.json')
+            
+            cached = self._load_cached_summary(summary_file, cache_file)
+            if cached:
+                logger.info(f"Weekly summary unchanged, reusing: {summary_file.name}")
+                return cached
+            
+            generated_at_utc = datetime.utcnow().strftime('%Y-%m-%d %H:%M:%S')
+            
+            # Transactions and balances are independent - fetch them concurrently
+            with ThreadPoolExecutor(max_workers=2) as pool:
+                transactions_future = pool.submit(
+                    self.read_transactions,
+                    date_from=week_start.strftime('%Y-%m-%d'),
+                    date_to=week_end.strftime('%Y-%m-%d'),
+                    limit=200,
+                    fields=['name', 'move_type', 'amount_total', 'state', 'partner_id']
+                )
+                balances_future = pool.submit(self.fetch_balances)
+                transactions_result = transactions_future.result()
+                balances_result = balances_future.result()
             
             if not transactions_result.get('success'):
                 return transactions_result
             
             transactions = transactions_result.get('transactions', [])
             
-            # Calculate totals
-            total_income = sum(t['amount'] for t in transactions if t['type'] == 'out_invoice')
-            total_expenses = sum(t['amount'] for t in transactions if t['type'] == 'in_invoice')
+            # Calculate totals and split invoices/bills in one pass
+            total_income = total_expenses = 0.0
+            invoices, bills = [], []
+            for t in transactions:
+                if t['type'] == 'out_invoice':
+                    total_income += t['amount']
+                    invoices.append(t)
+                elif t['type'] == 'in_invoice':
+                    total_expenses += t['amount']
+                    bills.append(t)
             net_income = total_income - total_expenses
             
-            # Fetch balances
-            balances_result = self.fetch_balances()
             balances = balances_result.get('balances', {})
             
             # Generate summary markdown
@@ -488,18 +788,17 @@ class OdooAccountingAgent:
                 total_expenses=total_expenses,
                 net_income=net_income,
                 transactions=transactions,
-                balances=balances
+                balances=balances,
+                invoices=invoices,
+                bills=bills
             )
             
             # Save summary
-            summary_file = self.accounting_dir / f"weekly_financial_summary_{week_start.strftime('%Y%m%d')}.md"
-            
-            with open(summary_file, 'w', encoding='utf-8') as f:
-                f.write(summary_md)
+            _atomic_write(summary_file, summary_md)
             
             logger.info(f"Weekly summary saved: {summary_file.name}")
             
-            return {
+            result = {
                 'success': True,
                 'summary_file': str(summary_file),
                 'period': f"{week_start.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')}",
@@ -508,22 +807,75 @@ class OdooAccountingAgent:
                 'net_income': net_income
             }
             
+            # Cache the result for live data so unchanged weeks are not regenerated
+            if not transactions_result.get('demo_mode'):
+                cache = dict(result)
+                cache['max_txn_id'] = max((t['id'] for t in transactions), default=0)
+                cache['generated_at'] = generated_at_utc
+                _atomic_write(cache_file, json.dumps(cache, indent=2))
+            
+            return result
+            
         except Exception as e:
             logger.error(f"Failed to generate weekly summary: {e}")
             return {'success': False, 'error': str(e)}
     
+    def _load_cached_summary(self, summary_file: Path, cache_file: Path) -> Optional[Dict]:
+        """
+        Return the cached weekly summary if no account.move was created or
+        modified in Odoo since it was generated, otherwise None.
+        """
+        if not self.odoo or not self.odoo.connected:
+            return None
+        if not summary_file.exists() or not cache_file.exists():
+            return None
+        
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cache = json.load(f)
+            
+            # The id check guards against clock skew between this host and Odoo
+            changed = self.odoo.search_read(
+                'account.move',
+                domain=['|',
+                        ['id', '>', cache['max_txn_id']],
+                        ['write_date', '>', cache['generated_at']]],
+                fields=['id'],
+                limit=1
+            )
+        except Exception as e:
+            logger.warning(f"Ignoring weekly summary cache: {e}")
+            return None
+        
+        if changed:
+            return None
+        
+        return {k: v for k, v in cache.items() if k not in ('max_txn_id', 'generated_at')}
+    
+    @staticmethod
+    def _format_transaction_rows(transactions: List[Dict]) -> List[str]:
+        """Render invoice/bill table rows (name, partner, amount, state)."""
+        return [
+            f"| {t['name']} | {t.get('partner', 'N/A')} | ${t['amount']:,.2f} | {t['state']} |\n"
+            for t in transactions
+        ]
+    
     def _create_summary_markdown(self, week_start: datetime, week_end: datetime,
                                   total_income: float, total_expenses: float,
                                   net_income: float, transactions: List[Dict],
-                                  balances: Dict) -> str:
+                                  balances: Dict,
+                                  invoices: Optional[List[Dict]] = None,
+                                  bills: Optional[List[Dict]] = None) -> str:
         """Create weekly summary markdown content."""
         week_number = week_start.isocalendar()[1]
         
-        # Separate invoices and bills
-        invoices = [t for t in transactions if t['type'] == 'out_invoice']
-        bills = [t for t in transactions if t['type'] == 'in_invoice']
+        # Separate invoices and bills unless the caller already did
+        if invoices is None:
+            invoices = [t for t in transactions if t['type'] == 'out_invoice']
+        if bills is None:
+            bills = [t for t in transactions if t['type'] == 'in_invoice']
         
-        content = f"""# Weekly Financial Summary
+        parts: List[str] = [f"""# Weekly Financial Summary
 
 **Week:** {week_number}, {week_start.year}
 **Period:** {week_start.strftime('%Y-%m-%d')} to {week_end.strftime('%Y-%m-%d')}
@@ -542,39 +894,37 @@ class OdooAccountingAgent:
 
 ## Invoices Created
 
-"""
+"""]
         
         if invoices:
-            content += "| Invoice | Customer | Amount | Status |\n"
-            content += "|---------|----------|--------|--------|\n"
-            for inv in invoices[:10]:  # Limit to 10
-                content += f"| {inv['name']} | {inv.get('partner', 'N/A')} | ${inv['amount']:,.2f} | {inv['state']} |\n"
+            parts.append("| Invoice | Customer | Amount | Status |\n")
+            parts.append("|---------|----------|--------|--------|\n")
+            parts.extend(self._format_transaction_rows(invoices[:10]))  # Limit to 10
         else:
-            content += "*No invoices this week*\n"
+            parts.append("*No invoices this week*\n")
         
-        content += "\n---\n\n## Bills Paid\n\n"
+        parts.append("\n---\n\n## Bills Paid\n\n")
         
         if bills:
-            content += "| Bill | Vendor | Amount | Status |\n"
-            content += "|------|--------|--------|--------|\n"
-            for bill in bills[:10]:  # Limit to 10
-                content += f"| {bill['name']} | {bill.get('partner', 'N/A')} | ${bill['amount']:,.2f} | {bill['state']} |\n"
+            parts.append("| Bill | Vendor | Amount | Status |\n")
+            parts.append("|------|--------|--------|--------|\n")
+            parts.extend(self._format_transaction_rows(bills[:10]))  # Limit to 10
         else:
-            content += "*No bills this week*\n"
+            parts.append("*No bills this week*\n")
         
-        content += "\n---\n\n## Account Balances\n\n"
+        parts.append("\n---\n\n## Account Balances\n\n")
         
         if balances:
-            content += "| Account | Balance |\n"
-            content += "|---------|---------|\n"
-            content += f"| Accounts Receivable | ${balances.get('accounts_receivable', 0):,.2f} |\n"
-            content += f"| Accounts Payable | ${balances.get('accounts_payable', 0):,.2f} |\n"
-            content += f"| Bank | ${balances.get('bank', 0):,.2f} |\n"
-            content += f"| **Net** | **${balances.get('net', 0):,.2f}** |\n"
+            parts.append("| Account | Balance |\n")
+            parts.append("|---------|---------|\n")
+            parts.append(f"| Accounts Receivable | ${balances.get('accounts_receivable', 0):,.2f} |\n")
+            parts.append(f"| Accounts Payable | ${balances.get('accounts_payable', 0):,.2f} |\n")
+            parts.append(f"| Bank | ${balances.get('bank', 0):,.2f} |\n")
+            parts.append(f"| **Net** | **${balances.get('net', 0):,.2f}** |\n")
         else:
-            content += "*Balance data not available*\n"
+            parts.append("*Balance data not available*\n")
         
-        content += f"""
+        parts.append(f"""
 ---
 
 ## Notes
@@ -586,9 +936,9 @@ class OdooAccountingAgent:
 ---
 
 *Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}*
-"""
+""")
         
-        return content
+        return ''.join(parts)
     
     def execute(self, task_input: Dict) -> Dict:
         """Execute accounting task."""
@@ -625,10 +975,11 @@ class OdooAccountingAgent:
         else:
             # Default: try to determine action from content
             content = task_input.get('content', '')
+            lowered = content.lower()
             
-            if 'invoice' in content.lower():
+            if 'invoice' in lowered:
                 # Extract invoice details from content
-                amount_match = re.search(r'\$?([\d,]+\.?\d*)', content)
+                amount_match = _AMOUNT_RE.search(content)
                 amount = float(amount_match.group(1).replace(',', '')) if amount_match else 0
                 
                 return self.create_invoice({
@@ -637,13 +988,13 @@ class OdooAccountingAgent:
                     'description': content[:200]
                 })
             
-            elif 'summary' in content.lower() or 'report' in content.lower():
+            elif 'summary' in lowered or 'report' in lowered:
                 return self.generate_weekly_summary()
             
-            elif 'balance' in content.lower():
+            elif 'balance' in lowered:
                 return self.fetch_balances()
             
-            elif 'transaction' in content.lower() or 'transaction' in content.lower():
+            elif 'transaction' in lowered:
                 return self.read_transactions()
             
             else:
@@ -652,32 +1003,57 @@ class OdooAccountingAgent:
                     'error': f'Unknown accounting action: {action}'
                 }
     
-    def scan_for_accounting_tasks(self) -> List[Path]:
-        """Scan Needs_Action for accounting tasks."""
+    def _remember_task(self, name: str, mtime: int):
+        """Record a non-accounting file's mtime, evicting the least recently seen entry when full."""
+        self._seen[name] = mtime
+        self._seen.move_to_end(name)
+        if len(self._seen) > self.MAX_SEEN_TASKS:
+            self._seen.popitem(last=False)
+    
+    def scan_for_accounting_tasks(self) -> List[Tuple[Path, str]]:
+        """
+        Scan Needs_Action for accounting tasks.
+        
+        Returns (path, content) pairs so callers can parse the content that
+        was already read instead of opening each file a second time.
+        """
         tasks = []
         
         if not self.needs_action_dir.exists():
             return tasks
         
+        present = set()
         for file_path in self.needs_action_dir.iterdir():
             if file_path.is_file() and file_path.suffix.lower() == '.md':
+                present.add(file_path.name)
                 if file_path.name in self.processed_tasks:
                     continue
                 
+                # Skip non-accounting files that have not changed since
+                # they were last read
+                mtime = file_path.stat().st_mtime_ns
+                if self._seen.get(file_path.name) == mtime:
+                    self._seen.move_to_end(file_path.name)
+                    continue
+                
                 with open(file_path, 'r', encoding='utf-8') as f:
                     content = f.read()
                 
                 # Check for accounting task indicators
-                is_accounting = (
-                    'skill: odoo_accounting' in content.lower() or
-                    'skill:accounting' in content.lower() or
-                    ('invoice' in content.lower() and 'create' in content.lower()) or
-                    ('financial' in content.lower() and 'summary' in content.lower()) or
-                    ('balance' in content.lower())
-                )
-                
-                if is_accounting:
-                    tasks.append(file_path)
+                if _is_accounting_task(content):
+                    if _RESULT_SECTION_RE.search(content):
+                        # Executed before it left the directory or before a
+                        # restart; never run it again
+                        self.processed_tasks.add(file_path.name)
+                    else:
+                        tasks.append((file_path, content))
+                else:
+                    self._remember_task(file_path.name, mtime)
+        
+        # Forget files that are no longer in Needs_Action
+        self.processed_tasks &= present
+        for name in [name for name in self._seen if name not in present]:
+            del self._seen[name]
         
         return tasks
     
@@ -728,9 +1104,9 @@ class OdooAccountingAgent:
 """
                 
                 # Update status
-                content = re.sub(r'(status:\s*)[^\n]+', r'\1done', content, flags=re.MULTILINE)
+                content = _STATUS_RE.sub(r'\1done', content)
                 if 'completed:' not in content:
-                    content = re.sub(r'(status:\s*done)', f'\\1\ncompleted: {timestamp}', content)
+                    content = _STATUS_DONE_RE.sub(f'\\1\ncompleted: {timestamp}', content)
             else:
                 result_md = f"""
 ---
@@ -741,16 +1117,27 @@ class OdooAccountingAgent:
 **Error:** {result.get('error', 'Unknown error')}
 """
             
-            new_content = content + result_md
-            
-            with open(task_file, 'w', encoding='utf-8') as f:
-                f.write(new_content)
+            _atomic_write(task_file, content + result_md)
             
             logger.info(f"Task file updated: {task_file.name}")
             
         except Exception as e:
             logger.error(f"Failed to update task file: {e}")
     
+    def _start_watcher(self):
+        """Start a watchdog observer on Needs_Action, or return None to poll."""
+        if Observer is None:
+            logger.info("watchdog not installed - polling Needs_Action every 5s")
+            return None
+        
+        self.needs_action_dir.mkdir(parents=True, exist_ok=True)
+        observer = Observer()
+        observer.schedule(_TaskDirHandler(self._wake), str(self.needs_action_dir), recursive=False)
+        observer.daemon = True
+        observer.start()
+        logger.info(f"Watching {self.needs_action_dir} for task changes")
+        return observer
+    
     def run(self):
         """Main accounting agent loop."""
         logger.info("=" * 60)
@@ -765,17 +1152,22 @@ class OdooAccountingAgent:
         else:
             logger.warning("Running in demo mode - no live Odoo connection")
         
+        observer = self._start_watcher()
+        # With file events we only need an occasional safety rescan
+        poll_interval = 60 if observer else 5
+        
         while True:
             try:
+                self._wake.clear()
                 tasks = self.scan_for_accounting_tasks()
                 
                 if tasks:
                     logger.info(f"Found {len(tasks)} accounting task(s)")
                     
-                    for task_file in tasks:
+                    for task_file, raw_content in tasks:
                         logger.info(f"Processing: {task_file.name}")
                         
-                        content, frontmatter = self.read_task(task_file)
+                        content, frontmatter = self.parse_task(raw_content)
                         
                         result = self.execute({
                             'action': frontmatter.get('action', ''),
@@ -787,16 +1179,21 @@ class OdooAccountingAgent:
                             'due_date': frontmatter.get('due_date')
                         })
                         
-                        self.update_task_file(task_file, result)
                         self.processed_tasks.add(task_file.name)
+                        self.update_task_file(task_file, result)
                     
                     logger.info("Waiting for more tasks...")
                 
-                time.sleep(5)
+                self._wake.wait(poll_interval)
                 
             except KeyboardInterrupt:
                 logger.info("")
                 logger.info("Odoo Accounting Agent stopping...")
+                if observer:
+                    observer.stop()
+                    observer.join()
+                if self.odoo:
+                    self.odoo.close()
                 break
             except Exception as e:
                 logger.error(f"Error in accounting agent loop: {e}")
@@ -19,8 +19,13 @@ Sensitive Actions:
 - Database modifications
 - Production deployments
 
+Requirements:
+    pip install watchdog  # optional, event-driven monitoring
+    pip install pyahocorasick  # optional, single-pass keyword detection
+
 Usage:
     python approval_agent.py
+    python approval_agent.py --poll   # force 5s polling instead of file events
 
 Stop:
     Press Ctrl+C to gracefully stop
@@ -31,11 +36,26 @@ import sys
 import re
 import shutil
 import logging
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Set
+from typing import Dict, List, Optional, Tuple
 from enum import Enum
+from collections import OrderedDict
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
 
 # Configure logging
 logging.basicConfig(
@@ -47,6 +67,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger("ApprovalAgent")
 
+_FRONTMATTER_RE = re.compile(r'^---\s*\n(.*?)\n---\s*\n', re.DOTALL)
+
+# Human decision markers in an approval request, scanned in one pass
+_DECISION_RE = re.compile(
+    r'APPROVED:\s*(?:(?P<yes>YES)|(?P<no>NO))'
+    r'|(?P<rejected>REJECTED:\s*YES)'
+    r'|(?P<info>NEEDS INFO|NEEDS_MORE_INFO|MORE INFORMATION)',
+    re.IGNORECASE
+)
+_APPROVER_RE = re.compile(r'Approved by:\s*([^\n]+)')
+_REASON_RE = re.compile(r'Reason:\s*([^\n]+)')
+
+
+def _decode_text(raw: bytes) -> str:
+    """Decode file bytes the way open(..., 'r', encoding='utf-8') would."""
+    return raw.decode('utf-8').replace('\r\n', '\n').replace('\r', '\n')
+
+
+def _link_or_copy(src: Path, dst: Path):
+    """
+    Hardlink src to dst (no data copy), falling back to shutil.copy2 when
+    linking is not possible, e.g. across filesystems.
+    
+    The two names share one inode, so later changes to dst must go through
+    _replace_text() rather than being written in place.
+    """
+    try:
+        if dst.exists():
+            dst.unlink()
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+
+
+def _fast_move(src: Path, dst: Path):
+    """
+    Move src to dst with a single atomic rename when both are on the same
+    filesystem, falling back to shutil.move (copy + delete) otherwise.
+    """
+    try:
+        os.replace(src, dst)
+    except OSError:
+        shutil.move(str(src), str(dst))
+
+
+def _replace_text(path: Path, data: str):
+    """Write text to a new inode and rename it over path (breaks any hardlink)."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(data)
+    os.replace(tmp_path, path)
+
 
 class ApprovalStatus(Enum):
     """Approval status states."""
@@ -68,6 +140,38 @@ class SensitiveActionType(Enum):
     OTHER = "other"
 
 
+class _TaskDirHandler(FileSystemEventHandler):
+    """Wakes the agent loop when a markdown file is written or moved in."""
+    
+    def __init__(self, wake: threading.Event):
+        super().__init__()
+        self.wake = wake
+    
+    def on_any_event(self, event):
+        if event.is_directory:
+            return
+        paths = (event.src_path, getattr(event, 'dest_path', ''))
+        if any(str(p).lower().endswith('.md') for p in paths):
+            self.wake.set()
+
+
+# Risk level shown in approval requests for each action type
+_RISK_LEVELS: Dict[SensitiveActionType, str] = {
+    SensitiveActionType.EMAIL: "MEDIUM",
+    SensitiveActionType.SOCIAL_POST: "LOW",
+    SensitiveActionType.PAYMENT: "HIGH",
+    SensitiveActionType.DATABASE_CHANGE: "HIGH",
+    SensitiveActionType.PRODUCTION_DEPLOY: "CRITICAL",
+    SensitiveActionType.API_KEY_ACCESS: "HIGH",
+    SensitiveActionType.DATA_EXPORT: "MEDIUM",
+    SensitiveActionType.OTHER: "MEDIUM"
+}
+
+# Action types treated as reversible / affecting external parties
+_REVERSIBLE_TYPES = frozenset({SensitiveActionType.EMAIL, SensitiveActionType.SOCIAL_POST})
+_EXTERNAL_TYPES = _REVERSIBLE_TYPES
+
+
 class ApprovalAgent:
     """
     Approval Agent for AI Employee Vault.
@@ -112,6 +216,13 @@ class ApprovalAgent:
     # Approval folder name
     NEEDS_APPROVAL_DIR_NAME = "Needs_Approval"
     
+    # Seconds between scans when polling, and between safety rescans with watchdog
+    POLL_INTERVAL = 5
+    WATCH_RESCAN_INTERVAL = 60
+    
+    # Upper bound on remembered task names
+    MAX_PROCESSED_TASKS = 10_000
+    
     def __init__(self, needs_action_dir: Path, needs_approval_dir: Path, 
                  logs_dir: Path, done_dir: Path):
         self.needs_action_dir = needs_action_dir
@@ -120,45 +231,143 @@ class ApprovalAgent:
         self.done_dir = done_dir
         
         self.pending_approvals: Dict[str, ApprovalStatus] = {}
-        self.processed_tasks: Set[str] = set()
+        # Task names already routed for approval, as a bounded LRU
+        self.processed_tasks: "OrderedDict[str, None]" = OrderedDict()
+        
+        # Approval log rows waiting to be flushed once per loop iteration
+        self._log_buf: List[str] = []
+        self._log_header_written = False
+        
+        # Approval filename -> ((mtime_ns, size), status, detail) from the last check
+        self._approval_cache: Dict[str, Tuple[Tuple[int, int], ApprovalStatus, Optional[str]]] = {}
+        
+        # Set by the watchdog handler when either monitored folder changes
+        self._wake = threading.Event()
+        
+        # Worker threads for reading/matching Needs_Action files in parallel
+        self._scan_pool = ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 4))
+        
+        # Multi-keyword matcher built once (None when pyahocorasick is missing),
+        # plus the byte-encoded keyword table used by the plain fallback loop
+        self._keyword_automaton = self._build_keyword_automaton()
+        self._keyword_bytes = [
+            (action_type, [keyword.encode('ascii') for keyword in keywords])
+            for action_type, keywords in self.SENSITIVE_KEYWORDS.items()
+        ]
         
-        # Ensure directories exist
-        self.needs_action_dir.mkdir(parents=True, exist_ok=True)
-        self.needs_approval_dir.mkdir(parents=True, exist_ok=True)
-        self.logs_dir.mkdir(parents=True, exist_ok=True)
-        self.done_dir.mkdir(parents=True, exist_ok=True)
+        # Ensure directories exist. A bare mkdir is a single syscall when the
+        # directory is already there; only missing parents take the slow path.
+        for directory in (self.needs_action_dir, self.needs_approval_dir,
+                          self.logs_dir, self.done_dir):
+            try:
+                os.mkdir(directory)
+            except FileExistsError:
+                pass
+            except FileNotFoundError:
+                directory.mkdir(parents=True, exist_ok=True)
     
-    def scan_for_sensitive_tasks(self) -> List[Path]:
-        """Scan Needs_Action for tasks requiring approval."""
+    def scan_for_sensitive_tasks(self) -> List[Tuple[Path, SensitiveActionType, bytes]]:
+        """
+        Scan Needs_Action for tasks requiring approval.
+        
+        Returns (path, action_type, raw_bytes) so the approval request can be
+        built from the bytes already read during detection.
+        """
         sensitive_tasks = []
         
         if not self.needs_action_dir.exists():
             return sensitive_tasks
         
-        for file_path in self.needs_action_dir.iterdir():
-            if (file_path.is_file() and 
-                file_path.suffix.lower() == '.md' and
-                file_path.name not in self.processed_tasks):
-                
-                action_type = self.detect_sensitive_action(file_path)
-                if action_type:
-                    sensitive_tasks.append((file_path, action_type))
+        with os.scandir(self.needs_action_dir) as entries:
+            # Name checks first: they need no stat() call
+            candidates = []
+            for entry in entries:
+                if not entry.name.lower().endswith('.md'):
+                    continue
+                if entry.name in self.processed_tasks:
+                    # Still present - keep it from being evicted
+                    self.processed_tasks.move_to_end(entry.name)
+                    continue
+                if entry.is_file():
+                    candidates.append(Path(entry.path))
+        
+        # Reading + matching is independent per file, so overlap the I/O
+        results = self._scan_pool.map(self._detect_with_content, candidates)
+        for file_path, detected in zip(candidates, results):
+            if detected:
+                sensitive_tasks.append((file_path, *detected))
         
         return sensitive_tasks
     
-    def detect_sensitive_action(self, file_path: Path) -> Optional[SensitiveActionType]:
-        """Detect if task requires approval and what type."""
-        try:
-            with open(file_path, 'r', encoding='utf-8') as f:
-                content = f.read().lower()
-            
-            # Check each sensitive action type
-            for action_type, keywords in self.SENSITIVE_KEYWORDS.items():
+    def _mark_processed(self, name: str):
+        """Remember a routed task, evicting the least recently seen name when full."""
+        self.processed_tasks[name] = None
+        self.processed_tasks.move_to_end(name)
+        if len(self.processed_tasks) > self.MAX_PROCESSED_TASKS:
+            self.processed_tasks.popitem(last=False)
+    
+    def _build_keyword_automaton(self):
+        """
+        Compile SENSITIVE_KEYWORDS into one Aho-Corasick automaton.
+        
+        Each keyword maps to (priority, action_type), where priority is the
+        action type's position in SENSITIVE_KEYWORDS, so a single pass can
+        reproduce the "first matching type wins" order of the plain loop.
+        """
+        if ahocorasick is None:
+            return None
+        
+        automaton = ahocorasick.Automaton()
+        for priority, (action_type, keywords) in enumerate(self.SENSITIVE_KEYWORDS.items()):
+            for keyword in keywords:
+                if not automaton.exists(keyword):
+                    automaton.add_word(keyword, (priority, action_type))
+        automaton.make_automaton()
+        return automaton
+    
+    def _match_sensitive_keywords(self, content: bytes) -> Optional[SensitiveActionType]:
+        """
+        Return the highest-priority action type whose keyword occurs in content.
+        
+        ``content`` is raw, ASCII-lowercased file bytes. All keywords are
+        ASCII, so matching on bytes avoids a UTF-8 decode and a Unicode
+        lower() of the whole file.
+        
+        There is deliberately no cheap prefilter in front of this: short
+        keywords such as '$', 'pay' and 'prod' occur in most prose, and a
+        compiled alternation of all keywords is slower than either path.
+        """
+        if self._keyword_automaton is None:
+            for action_type, keywords in self._keyword_bytes:
                 for keyword in keywords:
                     if keyword in content:
-                        logger.info(f"Detected {action_type.value} action in {file_path.name}")
                         return action_type
+            return None
+        
+        # latin-1 maps bytes 1:1 to code points, so ASCII keywords match exactly
+        best = None
+        for _, (priority, action_type) in self._keyword_automaton.iter(content.decode('latin-1')):
+            if best is None or priority < best[0]:
+                best = (priority, action_type)
+                if priority == 0:
+                    break
+        return best[1] if best else None
+    
+    def detect_sensitive_action(self, file_path: Path) -> Optional[SensitiveActionType]:
+        """Detect if task requires approval and what type."""
+        detected = self._detect_with_content(file_path)
+        return detected[0] if detected else None
+    
+    def _detect_with_content(self, file_path: Path) -> Optional[Tuple[SensitiveActionType, bytes]]:
+        """Detect a sensitive action, also returning the raw bytes that were read."""
+        try:
+            with open(file_path, 'rb') as f:
+                raw = f.read()
             
+            action_type = self._match_sensitive_keywords(raw.lower())
+            if action_type:
+                logger.info(f"Detected {action_type.value} action in {file_path.name}")
+                return action_type, raw
             return None
             
         except Exception as e:
@@ -170,51 +379,61 @@ class ApprovalAgent:
         with open(file_path, 'r', encoding='utf-8') as f:
             content = f.read()
         
+        return self.parse_task(content)
+    
+    def parse_task(self, content: str) -> Tuple[str, Dict]:
+        """Split already-read task content into body + frontmatter."""
         frontmatter = {}
         body = content
         
-        # Parse frontmatter
-        frontmatter_match = re.match(r'^---\s*\n(.*?)\n---\s*\n', content, re.DOTALL)
+        # Parse frontmatter (files without a leading '---' cannot have any)
+        frontmatter_match = _FRONTMATTER_RE.match(content) if content.startswith('---') else None
         if frontmatter_match:
-            fm_text = frontmatter_match.group(1)
-            for line in fm_text.split('\n'):
-                if ':' in line:
-                    key, value = line.split(':', 1)
+            for line in frontmatter_match.group(1).splitlines():
+                key, sep, value = line.partition(':')
+                if sep:
                     frontmatter[key.strip()] = value.strip()
             body = content[frontmatter_match.end():]
         
         return body, frontmatter
     
     def generate_approval_request(self, file_path: Path, 
-                                   action_type: SensitiveActionType) -> str:
-        """Generate approval request markdown content."""
-        content, frontmatter = self.read_task(file_path)
+                                   action_type: SensitiveActionType,
+                                   raw_content: Optional[str] = None) -> str:
+        """
+        Generate approval request markdown content.
         
-        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        Pass ``raw_content`` when the task text is already in memory to
+        avoid reading the file again.
+        """
+        if raw_content is None:
+            content, frontmatter = self.read_task(file_path)
+        else:
+            content, frontmatter = self.parse_task(raw_content)
+        
+        now = datetime.now()
+        timestamp = now.strftime('%Y-%m-%d %H:%M:%S')
+        expires = now.replace(hour=23, minute=59, second=59).strftime('%Y-%m-%d %H:%M:%S')
         
         # Determine risk level based on action type
-        risk_levels = {
-            SensitiveActionType.EMAIL: "MEDIUM",
-            SensitiveActionType.SOCIAL_POST: "LOW",
-            SensitiveActionType.PAYMENT: "HIGH",
-            SensitiveActionType.DATABASE_CHANGE: "HIGH",
-            SensitiveActionType.PRODUCTION_DEPLOY: "CRITICAL",
-            SensitiveActionType.API_KEY_ACCESS: "HIGH",
-            SensitiveActionType.DATA_EXPORT: "MEDIUM",
-            SensitiveActionType.OTHER: "MEDIUM"
-        }
-        
-        risk_level = risk_levels.get(action_type, "MEDIUM")
+        risk_level = _RISK_LEVELS.get(action_type, "MEDIUM")
+        
+        title = frontmatter.get('title', file_path.stem)
+        action_label = action_type.value.replace('_', ' ').title()
+        summary = content[:500]
+        if len(content) > 500:
+            summary += '...'
         
         # Generate approval request
-        approval_content = f"""---
-title: Approval Request: {frontmatter.get('title', file_path.stem)}
+        parts = [
+            f"""---
+title: Approval Request: {title}
 original_task: {file_path.name}
 request_type: {action_type.value}
 risk_level: {risk_level}
 status: pending_approval
 created: {timestamp}
-expires: {(datetime.now().replace(hour=23, minute=59, second=59)).strftime('%Y-%m-%d %H:%M:%S')}
+expires: {expires}
 ---
 
 # Approval Request
@@ -223,7 +442,7 @@ expires: {(datetime.now().replace(hour=23, minute=59, second=59)).strftime('%Y-%
 
 **Original Task:** `{file_path.name}`
 
-**Action Type:** {action_type.value.replace('_', ' ').title()}
+**Action Type:** {action_label}
 
 **Risk Level:** {risk_level}
 
@@ -237,13 +456,15 @@ This task requires **human approval** before proceeding because it involves a **
 
 ## Task Summary
 
-**Title:** {frontmatter.get('title', file_path.stem)}
+**Title:** {title}
 
 **Priority:** {frontmatter.get('priority', 'standard')}
 
 **Description:**
 ```
-{content[:500]}{'...' if len(content) > 500 else ''}
+""",
+            summary,
+            f"""
 ```
 
 ---
@@ -252,10 +473,10 @@ This task requires **human approval** before proceeding because it involves a **
 
 | Factor | Assessment |
 |--------|------------|
-| **Action Type** | {action_type.value.replace('_', ' ').title()} |
+| **Action Type** | {action_label} |
 | **Risk Level** | {risk_level} |
-| **Reversible** | {'Yes' if action_type in [SensitiveActionType.EMAIL, SensitiveActionType.SOCIAL_POST] else 'No/Partial'} |
-| **Impact Scope** | {'External' if action_type in [SensitiveActionType.EMAIL, SensitiveActionType.SOCIAL_POST] else 'Internal'} |
+| **Reversible** | {'Yes' if action_type in _REVERSIBLE_TYPES else 'No/Partial'} |
+| **Impact Scope** | {'External' if action_type in _EXTERNAL_TYPES else 'Internal'} |
 
 ---
 
@@ -296,26 +517,35 @@ To approve or reject this request:
 
 ## Timeout
 
-This approval request will expire at: **{(datetime.now().replace(hour=23, minute=59, second=59)).strftime('%Y-%m-%d %H:%M:%S')}**
+This approval request will expire at: **{expires}**
 
 If not approved/rejected by then, the task will be automatically rejected.
 
 ---
 
 *Generated by AI Employee Approval Agent*
-"""
+""",
+        ]
         
-        return approval_content
+        return ''.join(parts)
     
-    def move_to_approval(self, file_path: Path, action_type: SensitiveActionType) -> Optional[Path]:
-        """Move task to Needs_Approval folder and create approval request."""
+    def move_to_approval(self, file_path: Path, action_type: SensitiveActionType,
+                         raw: Optional[bytes] = None) -> Optional[Path]:
+        """
+        Move task to Needs_Approval folder and create approval request.
+        
+        ``raw`` is the task file's bytes if the caller has already read them.
+        """
         try:
             # Create approval request filename
             approval_filename = f"approval_{file_path.stem}.md"
             approval_path = self.needs_approval_dir / approval_filename
             
             # Generate and save approval request
-            approval_content = self.generate_approval_request(file_path, action_type)
+            approval_content = self.generate_approval_request(
+                file_path, action_type,
+                raw_content=_decode_text(raw) if raw is not None else None
+            )
             
             with open(approval_path, 'w', encoding='utf-8') as f:
                 f.write(approval_content)
@@ -324,7 +554,7 @@ If not approved/rejected by then, the task will be automatically rejected.
             
             # Move original task to approval folder (keep beside approval request)
             task_copy_path = self.needs_approval_dir / file_path.name
-            shutil.copy2(file_path, task_copy_path)
+            _link_or_copy(file_path, task_copy_path)
             
             logger.info(f"Task copied to approval folder: {task_copy_path.name}")
             
@@ -343,27 +573,32 @@ If not approved/rejected by then, the task will be automatically rejected.
             with open(approval_path, 'r', encoding='utf-8') as f:
                 content = f.read()
             
-            # Look for approval decision
-            approved_yes = re.search(r'APPROVED:\s*YES', content, re.IGNORECASE)
-            approved_no = re.search(r'APPROVED:\s*NO', content, re.IGNORECASE)
-            rejected = re.search(r'REJECTED:\s*YES', content, re.IGNORECASE)
+            # Look for approval decision (an APPROVED: YES anywhere takes precedence)
+            approved_yes = rejected = needs_info = False
+            for match in _DECISION_RE.finditer(content):
+                if match.group('yes'):
+                    approved_yes = True
+                    break
+                if match.group('no') or match.group('rejected'):
+                    rejected = True
+                elif match.group('info'):
+                    needs_info = True
             
             if approved_yes:
                 # Extract approver info
-                approver_match = re.search(r'Approved by:\s*([^\n]+)', content)
+                approver_match = _APPROVER_RE.search(content)
                 approver = approver_match.group(1).strip() if approver_match else "Unknown"
                 
                 return ApprovalStatus.APPROVED, approver
             
-            if approved_no or rejected:
+            if rejected:
                 # Extract rejection reason
-                reason_match = re.search(r'Reason:\s*([^\n]+)', content)
+                reason_match = _REASON_RE.search(content)
                 reason = reason_match.group(1).strip() if reason_match else "No reason provided"
                 
                 return ApprovalStatus.REJECTED, reason
             
             # Check for needs more info
-            needs_info = re.search(r'NEEDS INFO|NEEDS_MORE_INFO|MORE INFORMATION', content, re.IGNORECASE)
             if needs_info:
                 return ApprovalStatus.NEEDS_INFO, "More information requested"
             
@@ -398,28 +633,33 @@ approved_at: {timestamp}
 
 """
                     
-                    # Insert after existing frontmatter
-                    if '---\n' in task_content:
-                        parts = task_content.split('---\n', 2)
-                        if len(parts) >= 2:
-                            task_content = f"---\n{parts[1]}---\n{approval_marker}{parts[2] if len(parts) > 2 else ''}"
+                    # Insert after existing frontmatter (located with two find() calls)
+                    start = task_content.find('---\n')
+                    if start != -1:
+                        start += 4
+                        end = task_content.find('---\n', start)
+                        if end == -1:
+                            task_content = f"---\n{task_content[start:]}---\n{approval_marker}"
+                        else:
+                            task_content = (f"---\n{task_content[start:end]}---\n"
+                                            f"{approval_marker}{task_content[end + 4:]}")
                     
-                    with open(task_path, 'w', encoding='utf-8') as f:
-                        f.write(task_content)
+                    _replace_text(task_path, task_content)
                     
                     # Move back to Needs_Action
                     destination = self.needs_action_dir / original_task
-                    shutil.move(str(task_path), str(destination))
+                    _fast_move(task_path, destination)
                     
                     logger.info(f"Approved task moved back to Needs_Action: {original_task}")
             
             # Move approval request to Done
             done_approval = self.done_dir / approval_path.name
-            shutil.move(str(approval_path), str(done_approval))
+            _fast_move(approval_path, done_approval)
             
             # Clean up tracking
             if approval_path.name in self.pending_approvals:
                 del self.pending_approvals[approval_path.name]
+            self._approval_cache.pop(approval_path.name, None)
             
             # Log approval
             self.log_approval_event(approval_path.name, "APPROVED", approver)
@@ -451,22 +691,24 @@ approved_at: {timestamp}
 This task was rejected during the approval process and will not be executed.
 """
                     
-                    with open(task_path, 'a', encoding='utf-8') as f:
-                        f.write(rejection_note)
+                    with open(task_path, 'r', encoding='utf-8') as f:
+                        task_content = f.read()
+                    _replace_text(task_path, task_content + rejection_note)
                     
                     # Move to Done
                     done_task = self.done_dir / original_task
-                    shutil.move(str(task_path), str(done_task))
+                    _fast_move(task_path, done_task)
                     
                     logger.info(f"Rejected task moved to Done: {original_task}")
             
             # Move approval request to Done
             done_approval = self.done_dir / approval_path.name
-            shutil.move(str(approval_path), str(done_approval))
+            _fast_move(approval_path, done_approval)
             
             # Clean up tracking
             if approval_path.name in self.pending_approvals:
                 del self.pending_approvals[approval_path.name]
+            self._approval_cache.pop(approval_path.name, None)
             
             # Log rejection
             self.log_approval_event(approval_path.name, "REJECTED", reason)
@@ -475,24 +717,29 @@ This task was rejected during the approval process and will not be executed.
             logger.error(f"Failed to process rejected task: {e}")
     
     def log_approval_event(self, approval_name: str, decision: str, details: str):
-        """Log approval/rejection event."""
+        """Queue an approval/rejection event; written by _flush_log()."""
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self._log_buf.append(f"| {timestamp} | {approval_name} | {decision} | {details} |\n")
+        logger.debug("Approval event queued")
+    
+    def _flush_log(self):
+        """Append all queued approval events to approval_log.md in one write."""
+        if not self._log_buf:
+            return
+        
         try:
             log_file = self.logs_dir / "approval_log.md"
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
             
-            # Create log file if doesn't exist
-            if not log_file.exists():
-                with open(log_file, 'w', encoding='utf-8') as f:
+            with open(log_file, 'a', encoding='utf-8', buffering=1 << 16) as f:
+                # Write the table header once, when starting a new log file
+                if not self._log_header_written and f.tell() == 0:
                     f.write("# Approval Log\n\n")
                     f.write("| Timestamp | Request | Decision | Details |\n")
                     f.write("|-----------|---------|----------|--------|\n")
+                self._log_header_written = True
+                f.writelines(self._log_buf)
             
-            # Write entry
-            log_entry = f"| {timestamp} | {approval_name} | {decision} | {details} |\n"
-            
-            with open(log_file, 'a', encoding='utf-8') as f:
-                f.write(log_entry)
-            
+            self._log_buf.clear()
             logger.debug("Approval log updated")
             
         except Exception as e:
@@ -505,28 +752,72 @@ This task was rejected during the approval process and will not be executed.
         if not self.needs_approval_dir.exists():
             return pending
         
-        for file_path in self.needs_approval_dir.iterdir():
-            if (file_path.is_file() and 
-                file_path.suffix.lower() == '.md' and
-                file_path.name.startswith('approval_')):
-                
-                # Check if already processed
-                status, _ = self.check_approval_status(file_path)
-                if status == ApprovalStatus.PENDING:
-                    pending.append(file_path)
-                else:
-                    # Status changed - process it
-                    if status == ApprovalStatus.APPROVED:
-                        _, approver = self.check_approval_status(file_path)
-                        self.process_approved_task(file_path, approver or "Unknown")
-                    elif status == ApprovalStatus.REJECTED:
-                        _, reason = self.check_approval_status(file_path)
-                        self.process_rejected_task(file_path, reason or "Unknown")
+        with os.scandir(self.needs_approval_dir) as entries:
+            approval_files = [
+                (Path(entry.path), entry.stat())
+                for entry in entries
+                if (entry.name.startswith('approval_') and
+                    entry.name.lower().endswith('.md') and
+                    entry.is_file())
+            ]
+        
+        # Forget cached results for requests that are no longer in the folder
+        present = {file_path.name for file_path, _ in approval_files}
+        for name in list(self._approval_cache):
+            if name not in present:
+                del self._approval_cache[name]
+        
+        # Only re-read files whose (mtime, size) changed since last scan,
+        # reading the changed ones concurrently on the scan pool
+        changed = []
+        for file_path, st in approval_files:
+            key = (st.st_mtime_ns, st.st_size)
+            cached = self._approval_cache.get(file_path.name)
+            if not cached or cached[0] != key:
+                changed.append((file_path, key))
+        
+        results = self._scan_pool.map(self.check_approval_status, [path for path, _ in changed])
+        for (file_path, key), (status, detail) in zip(changed, results):
+            self._approval_cache[file_path.name] = (key, status, detail)
+        
+        for file_path, _ in approval_files:
+            _, status, detail = self._approval_cache[file_path.name]
+            
+            # Check if already processed
+            if status == ApprovalStatus.PENDING:
+                pending.append(file_path)
+            elif status == ApprovalStatus.APPROVED:
+                # Status changed - process it using the approver already extracted
+                self.process_approved_task(file_path, detail or "Unknown")
+            elif status == ApprovalStatus.REJECTED:
+                self.process_rejected_task(file_path, detail or "Unknown")
         
         return pending
     
-    def run(self):
-        """Main approval agent loop."""
+    def _start_watcher(self):
+        """Watch Needs_Action and Needs_Approval, or return None to poll."""
+        if Observer is None:
+            logger.info("watchdog not installed - polling every "
+                        f"{self.POLL_INTERVAL}s")
+            return None
+        
+        handler = _TaskDirHandler(self._wake)
+        observer = Observer()
+        observer.schedule(handler, str(self.needs_action_dir), recursive=False)
+        observer.schedule(handler, str(self.needs_approval_dir), recursive=False)
+        observer.daemon = True
+        observer.start()
+        logger.info("Watching for file changes (watchdog)")
+        return observer
+    
+    def run(self, poll: bool = False):
+        """
+        Main approval agent loop.
+        
+        Scans run when watchdog reports a change in either folder (with a
+        periodic safety rescan), or every POLL_INTERVAL seconds when
+        ``poll`` is set or watchdog is unavailable.
+        """
         logger.info("=" * 60)
         logger.info("Approval Agent started")
         logger.info(f"Monitoring: {self.needs_action_dir}")
@@ -540,30 +831,42 @@ This task was rejected during the approval process and will not be executed.
         logger.info("Waiting for tasks requiring approval...")
         logger.info("")
         
+        observer = None if poll else self._start_watcher()
+        wait_interval = self.WATCH_RESCAN_INTERVAL if observer else self.POLL_INTERVAL
+        
         while True:
             try:
+                self._wake.clear()
+                
                 # Scan for new sensitive tasks
                 sensitive_tasks = self.scan_for_sensitive_tasks()
                 
-                for task_file, action_type in sensitive_tasks:
+                for task_file, action_type, raw in sensitive_tasks:
                     logger.info(f"Sensitive action detected: {action_type.value}")
-                    self.move_to_approval(task_file, action_type)
-                    self.processed_tasks.add(task_file.name)
+                    self.move_to_approval(task_file, action_type, raw)
+                    self._mark_processed(task_file.name)
                 
                 # Check pending approvals for decisions
                 pending = self.scan_pending_approvals()
+                self._flush_log()
                 
                 if pending:
                     logger.info(f"Pending approvals: {len(pending)}")
                     for approval_path in pending:
                         logger.info(f"  - {approval_path.name}")
-                elif not sensitive_tasks:
-                    # No activity - wait before next check
-                    time.sleep(5)
+                
+                # Moving a task into Needs_Approval may have produced work - rescan
+                if not sensitive_tasks:
+                    self._wake.wait(wait_interval)
                 
             except KeyboardInterrupt:
                 logger.info("")
                 logger.info("Approval Agent stopping...")
+                self._flush_log()
+                self._scan_pool.shutdown(wait=False)
+                if observer:
+                    observer.stop()
+                    observer.join()
                 break
             except Exception as e:
                 logger.error(f"Error in approval agent loop: {e}")
@@ -579,4 +882,4 @@ if __name__ == "__main__":
         logs_dir=BASE_DIR / "Logs",
         done_dir=VAULT_PATH / "Done"
     )
-    agent.run()
+    agent.run(poll='--poll' in sys.argv)
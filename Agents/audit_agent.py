@@ -20,6 +20,13 @@ Storage:
 ├── retries/YYYY-MM/retries.log
 └── summary/daily_audit_summary.md
 
+Logs from finished months are compressed (.log.zst, or .log.gz without
+zstandard) and removed once older than the category's retention period.
+
+Requirements:
+    pip install orjson  # optional, faster event serialization
+    pip install zstandard  # optional, zstd for rotated logs (gzip otherwise)
+
 Usage:
     python audit_agent.py
 
@@ -28,18 +35,31 @@ Runs continuously, collecting audit events from all agents.
 
 import os
 import sys
+import io
+import atexit
+import base64
+import zlib
+import gzip
 import json
+import shutil
 import logging
+import mmap
 import time
 import re
 import threading
-import queue
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
-from dataclasses import dataclass, field, asdict
+from typing import BinaryIO, Deque, Dict, Iterator, List, Optional, Any, Pattern, Tuple
+from dataclasses import dataclass, field, fields
 from enum import Enum
-import traceback
+from functools import lru_cache
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
 # Configure logging
 logging.basicConfig(
@@ -52,6 +72,211 @@ logging.basicConfig(
 logger = logging.getLogger("AuditAgent")
 
 
+def _json_dumps(payload: Any) -> bytes:
+    """Encode an audit record as a JSON line body, using orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+    # Compact separators match orjson's layout (see _line_timestamp)
+    return json.dumps(payload, separators=(',', ':')).encode('utf-8')
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode an audit log line, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+# Lines written by to_json_bytes() start with the timestamp, which lets
+# query_events range-check a line before decoding it
+_TIMESTAMP_PREFIX = b'{"timestamp":"'
+
+
+def _line_timestamp(line: bytes) -> Optional[bytes]:
+    """Return the raw ISO timestamp of an audit log line, or None if not in the compact layout."""
+    if not line.startswith(_TIMESTAMP_PREFIX):
+        return None
+    start = len(_TIMESTAMP_PREFIX)
+    end = line.find(b'"', start)
+    return line[start:end] if end != -1 else None
+
+
+# Strings whose JSON text is identical for orjson and json.dumps
+# (printable ASCII, nothing escaped), so they can be searched for in the raw file
+_PLAIN_JSON_STR_RE = re.compile(r'^[\x20-\x21\x23-\x5b\x5d-\x7e]*$')
+
+
+def _json_literal(value: Any) -> Optional[str]:
+    """
+    JSON text for a filter value, or None if it cannot be searched for.
+    
+    Numbers and bools are excluded: filters compare with ==, so 1 also
+    matches 1.0 and true, which have different JSON text.
+    """
+    if value is None:
+        return 'null'
+    if isinstance(value, str) and _PLAIN_JSON_STR_RE.match(value):
+        return f'"{value}"'
+    return None
+
+
+def _filter_pattern(filters: Optional[Dict]) -> Optional[Pattern[bytes]]:
+    """
+    Build a byte regex that every line matching filters must contain.
+    
+    Uses the first filter with a searchable key/value; accepts both the
+    compact layout and the older json.dumps layout ('"key": value').
+    Returns None when no filter can be searched for.
+    """
+    for key, value in (filters or {}).items():
+        key_text = _json_literal(key) if isinstance(key, str) else None
+        value_text = _json_literal(value)
+        if key_text is not None and value_text is not None:
+            return re.compile(
+                re.escape(key_text.encode('ascii')) + rb': ?' +
+                re.escape(value_text.encode('ascii'))
+            )
+    return None
+
+
+def _matching_lines(f: BinaryIO, pattern: Pattern[bytes]) -> Iterator[bytes]:
+    """Yield each line of f that contains pattern, scanning an mmap of the file."""
+    if os.fstat(f.fileno()).st_size == 0:
+        return
+    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        line_end = -1
+        for m in pattern.finditer(mm):
+            if m.start() <= line_end:
+                continue  # another hit on a line already yielded
+            line_start = mm.rfind(b'\n', 0, m.start()) + 1
+            line_end = mm.find(b'\n', m.end())
+            if line_end == -1:
+                line_end = len(mm)
+            yield mm[line_start:line_end]
+
+
+@lru_cache(maxsize=None)
+def _zstandard():
+    """Import zstandard on first use (only log rotation and .zst reads need it); None if missing."""
+    try:
+        import zstandard
+    except ImportError:
+        return None
+    return zstandard
+
+
+def _compress_log(src: Path) -> Path:
+    """Compress src next to itself (zstd, or gzip without zstandard), then remove it."""
+    zstandard = _zstandard()
+    dst = src.with_name(src.name + ('.zst' if zstandard is not None else '.gz'))
+    tmp = dst.with_name(dst.name + '.tmp')
+    with open(src, 'rb') as fin, open(tmp, 'wb') as fout:
+        if zstandard is not None:
+            zstandard.ZstdCompressor(level=3).copy_stream(fin, fout)
+        else:
+            with gzip.GzipFile(fileobj=fout, mode='wb') as gz:
+                shutil.copyfileobj(fin, gz)
+    # The compressed file only appears once complete, so readers never see a partial one
+    os.replace(tmp, dst)
+    src.unlink()
+    return dst
+
+
+def _open_log_for_read(log_file: Path) -> Tuple[Optional[BinaryIO], bool]:
+    """
+    Open a monthly log (plain or rotated) for binary reading.
+    
+    Returns (file, compressed); file is None if no log exists. A rotated
+    copy wins over the plain file, which may not be unlinked yet.
+    """
+    for _ in range(2):
+        zst = log_file.with_name(log_file.name + '.zst')
+        if zst.exists():
+            zstandard = _zstandard()
+            if zstandard is None:
+                logger.warning(f"Skipping {zst.name}: pip install zstandard to read it")
+                return None, False
+            reader = zstandard.ZstdDecompressor().stream_reader(open(zst, 'rb'), closefd=True)
+            return io.BufferedReader(reader), True
+        gz = log_file.with_name(log_file.name + '.gz')
+        if gz.exists():
+            return gzip.open(gz, 'rb'), True
+        try:
+            return open(log_file, 'rb'), False
+        except FileNotFoundError:
+            # Compressed between the checks above and the open; look again
+            continue
+    return None, False
+
+
+# Stack traces longer than this are stored zlib-compressed + base64 with
+# this prefix; query_events expands them again
+_STACK_COMPRESS_MIN = 1024
+_COMPRESSED_STACK_PREFIX = "zlib+b64:"
+
+
+def _compress_stack(tb: str) -> str:
+    """Compress a long stack trace for storage (tracebacks compress ~3-4x)."""
+    if len(tb) <= _STACK_COMPRESS_MIN:
+        return tb
+    packed = base64.b64encode(zlib.compress(tb.encode('utf-8'))).decode('ascii')
+    return _COMPRESSED_STACK_PREFIX + packed
+
+
+def _expand_stack(tb: str) -> str:
+    """Inverse of _compress_stack; plain traces are returned unchanged."""
+    if not tb.startswith(_COMPRESSED_STACK_PREFIX):
+        return tb
+    packed = tb[len(_COMPRESSED_STACK_PREFIX):]
+    try:
+        return zlib.decompress(base64.b64decode(packed)).decode('utf-8')
+    except (ValueError, zlib.error):
+        return tb  # leave a damaged value as stored
+
+
+# (epoch second, isoformat() of that second) for _format_timestamp; a single
+# tuple so concurrent readers never see a mismatched pair
+_TS_CACHE: Tuple[int, str] = (-1, "")
+
+
+def _format_timestamp(ns: int) -> str:
+    """Format time.time_ns() like datetime.now().isoformat(), reusing the per-second prefix."""
+    global _TS_CACHE
+    sec, rem = divmod(ns, 1_000_000_000)
+    cached_sec, prefix = _TS_CACHE
+    if sec != cached_sec:
+        prefix = datetime.fromtimestamp(sec).isoformat()
+        _TS_CACHE = (sec, prefix)
+    micros = rem // 1000
+    return f"{prefix}.{micros:06d}" if micros else prefix
+
+
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+;
+# older interpreters fall back to regular instances.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+def _generate_to_dict(cls):
+    """
+    Class decorator: give an audit event dataclass a to_dict() that builds
+    its record as one dict literal (generated once from its fields, the
+    same way dataclasses generates __init__). No asdict() walk, no copies.
+    """
+    items = ", ".join(
+        "'timestamp': _format_timestamp(self.timestamp_ns)" if f.name == 'timestamp_ns'
+        else f"{f.name!r}: self.{f.name}"
+        for f in fields(cls)
+    )
+    namespace = {'_format_timestamp': _format_timestamp}
+    exec(f"def to_dict(self):\n    return {{{items}}}\n", namespace)
+    
+    to_dict = namespace['to_dict']
+    to_dict.__qualname__ = f"{cls.__name__}.to_dict"
+    to_dict.__doc__ = "Convert to a plain dict (no deep copy)."
+    cls.to_dict = to_dict
+    return cls
+
+
 class AuditCategory(Enum):
     """Audit log categories."""
     TASK_LIFECYCLE = "task_lifecycle"
@@ -62,6 +287,18 @@ class AuditCategory(Enum):
     SYSTEM = "system"
 
 
+# Each category gets a fixed ordinal (AuditCategory.X.idx) so per-category
+# tables can be plain lists instead of dicts keyed by the enum, whose
+# __hash__ is a Python-level call
+_CATEGORIES: Tuple[AuditCategory, ...] = tuple(AuditCategory)
+for _idx, _cat in enumerate(_CATEGORIES):
+    _cat.idx = _idx
+del _idx, _cat
+
+# Event category string -> ordinal, without going through Enum.__call__
+_CATEGORY_INDEX = {cat.value: cat.idx for cat in _CATEGORIES}
+
+
 class TaskEvent(Enum):
     """Task lifecycle events."""
     CREATED = "task_created"
@@ -86,10 +323,11 @@ class DecisionType(Enum):
     RECOVERY_ACTION = "recovery_action"
 
 
-@dataclass
+@_generate_to_dict
+@dataclass(**_DATACLASS_SLOTS)
 class AuditEvent:
     """Base audit event."""
-    timestamp: str
+    timestamp_ns: int  # time.time_ns() at creation; formatted when written
     category: str
     event: str
     agent_id: str
@@ -97,12 +335,26 @@ class AuditEvent:
     correlation_id: Optional[str] = None
     session_id: Optional[str] = None
     
+    @property
+    def timestamp(self) -> str:
+        """Event time as a local ISO 8601 string."""
+        return _format_timestamp(self.timestamp_ns)
+    
+    def stat_key(self) -> str:
+        """Key this event is counted under in the daily summary."""
+        return self.event
+    
+    def to_json_bytes(self) -> bytes:
+        """Convert to a UTF-8 encoded JSON line (without trailing newline)."""
+        return _json_dumps(self.to_dict())
+    
     def to_json(self) -> str:
         """Convert to JSON line."""
-        return json.dumps(asdict(self))
+        return self.to_json_bytes().decode('utf-8')
 
 
-@dataclass
+@_generate_to_dict
+@dataclass(**_DATACLASS_SLOTS)
 class TaskLifecycleEvent(AuditEvent):
     """Task lifecycle audit event."""
     task_id: str = ""
@@ -111,7 +363,8 @@ class TaskLifecycleEvent(AuditEvent):
     new_status: Optional[str] = None
 
 
-@dataclass
+@_generate_to_dict
+@dataclass(**_DATACLASS_SLOTS)
 class AgentDecisionEvent(AuditEvent):
     """Agent decision audit event."""
     decision_type: str = ""
@@ -120,7 +373,8 @@ class AgentDecisionEvent(AuditEvent):
     confidence: float = 0.0
 
 
-@dataclass
+@_generate_to_dict
+@dataclass(**_DATACLASS_SLOTS)
 class MCPCallEvent(AuditEvent):
     """MCP call audit event."""
     mcp_name: str = ""
@@ -130,9 +384,13 @@ class MCPCallEvent(AuditEvent):
     error: Optional[str] = None
     latency_ms: float = 0.0
     success: bool = True
+    
+    def stat_key(self) -> str:
+        return 'success' if self.success else 'error'
 
 
-@dataclass
+@_generate_to_dict
+@dataclass(**_DATACLASS_SLOTS)
 class FailureEvent(AuditEvent):
     """Failure audit event."""
     error_type: str = ""
@@ -142,9 +400,13 @@ class FailureEvent(AuditEvent):
     severity: str = "error"  # warning, error, critical
     resolved: bool = False
     resolution: Optional[str] = None
+    
+    def stat_key(self) -> str:
+        return self.severity
 
 
-@dataclass
+@_generate_to_dict
+@dataclass(**_DATACLASS_SLOTS)
 class RetryEvent(AuditEvent):
     """Retry audit event."""
     operation: str = ""
@@ -153,6 +415,9 @@ class RetryEvent(AuditEvent):
     backoff_seconds: float = 0.0
     reason: str = ""
     outcome: str = ""  # success, failed, pending
+    
+    def stat_key(self) -> str:
+        return self.outcome
 
 
 class AuditAgent:
@@ -172,33 +437,72 @@ class AuditAgent:
         AuditCategory.SYSTEM: 365
     }
     
+    # Writer batching: wait up to BATCH_TIMEOUT for a wake-up,
+    # then drain up to BATCH_MAX events per write
+    BATCH_TIMEOUT = 0.5
+    BATCH_MAX = 500
+    
+    # Back-pressure: cap the in-memory backlog. Events in BLOCKING_CATEGORIES
+    # wait up to BLOCK_TIMEOUT for the writer to make room; everything else
+    # is dropped (and counted) when the queue is full.
+    MAX_QUEUED_EVENTS = 50_000
+    QUEUE_HIGH_WATERMARK = 0.8
+    BLOCK_TIMEOUT = 1.0
+    BLOCKING_CATEGORIES = frozenset({
+        AuditCategory.FAILURE.value,
+        AuditCategory.TASK_LIFECYCLE.value
+    })
+    
+    # State checkpoint cadence (stop() and interpreter exit always save)
+    STATE_SAVE_INTERVAL = 60
+    STATE_SAVE_EVENTS = 10_000
+    
     def __init__(self, base_dir: Path, audit_dir: Optional[Path] = None):
         self.base_dir = base_dir
         self.audit_dir = audit_dir or (base_dir / "Audit")
         
-        # Create audit subdirectories
-        self.subdirs = {
-            AuditCategory.TASK_LIFECYCLE: self.audit_dir / "tasks",
-            AuditCategory.AGENT_DECISION: self.audit_dir / "agents",
-            AuditCategory.MCP_CALL: self.audit_dir / "mcp",
-            AuditCategory.FAILURE: self.audit_dir / "failures",
-            AuditCategory.RETRY: self.audit_dir / "retries",
-            AuditCategory.SYSTEM: self.audit_dir / "system"
+        # Create audit subdirectories (indexed by AuditCategory.idx)
+        subdir_names = {
+            AuditCategory.TASK_LIFECYCLE: "tasks",
+            AuditCategory.AGENT_DECISION: "agents",
+            AuditCategory.MCP_CALL: "mcp",
+            AuditCategory.FAILURE: "failures",
+            AuditCategory.RETRY: "retries",
+            AuditCategory.SYSTEM: "system"
         }
+        self.subdirs: List[Path] = [self.audit_dir / subdir_names[cat] for cat in _CATEGORIES]
         
-        for subdir in self.subdirs.values():
+        for subdir in self.subdirs:
             subdir.mkdir(parents=True, exist_ok=True)
         
         self.summary_dir = self.audit_dir / "summary"
         self.summary_dir.mkdir(parents=True, exist_ok=True)
         
-        # Event queue for async processing
-        self.event_queue: queue.Queue = queue.Queue()
+        # Event queue for async processing. Producers append and the single
+        # writer thread popleft()s; both are atomic under the GIL, so no lock
+        # is needed. _wake signals the writer that events are pending.
+        self._events: Deque[AuditEvent] = deque()
+        self._wake = threading.Event()
         
-        # In-memory buffers for batching
-        self.buffers: Dict[AuditCategory, List[AuditEvent]] = {
-            cat: [] for cat in AuditCategory
-        }
+        # Producers blocked on a full queue wait here for the writer
+        self._space = threading.Condition()
+        self._waiting_producers = 0
+        self._backlog_warned = False
+        
+        # Append handles kept open across batches (writer thread only);
+        # reopened when _get_log_file() moves to a new month
+        self._open_files: Dict[AuditCategory, Tuple[Path, BinaryIO]] = {}
+        
+        # Current month's log path per category, valid until _month_ends_at
+        # (epoch seconds of the next month's start)
+        self._month_cache: List[Optional[Path]] = [None] * len(_CATEGORIES)
+        self._month_ends_at = 0.0
+        
+        # Background compression of finished months + retention pruning
+        self._maintenance_pool: Optional[ThreadPoolExecutor] = None
+        
+        # In-memory buffers for batching (indexed by AuditCategory.idx)
+        self.buffers: List[List[AuditEvent]] = [[] for _ in _CATEGORIES]
         
         # Session tracking
         self.session_id = f"session_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
@@ -221,6 +525,8 @@ class AuditAgent:
         
         # Load existing state
         self._load_state()
+        self._last_state_save = time.monotonic()
+        self._events_at_state_save = self.stats.get('events_received', 0)
     
     def _load_state(self):
         """Load audit agent state."""
@@ -237,23 +543,58 @@ class AuditAgent:
     def _save_state(self):
         """Save audit agent state."""
         state_file = self.audit_dir / "audit_state.json"
+        tmp_file = state_file.with_name(state_file.name + '.tmp')
+        
+        state = {
+            'stats': self.stats,
+            'session_id': self.session_id,
+            'last_updated': datetime.now().isoformat()
+        }
         
         try:
-            with open(state_file, 'w') as f:
-                json.dump({
-                    'stats': self.stats,
-                    'session_id': self.session_id,
-                    'last_updated': datetime.now().isoformat()
-                }, f, indent=2)
+            if orjson is not None:
+                data = orjson.dumps(state, option=orjson.OPT_INDENT_2)
+            else:
+                data = json.dumps(state, indent=2).encode('utf-8')
+            
+            # Write then rename, so a crash mid-write never leaves a truncated state file
+            with open(tmp_file, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_file, state_file)
+            
+            self._last_state_save = time.monotonic()
+            self._events_at_state_save = self.stats.get('events_received', 0)
         except Exception as e:
             logger.error(f"Failed to save audit state: {e}")
     
+    def _maybe_save_state(self):
+        """Checkpoint state every STATE_SAVE_INTERVAL seconds or STATE_SAVE_EVENTS events."""
+        received = self.stats.get('events_received', 0)
+        if received == self._events_at_state_save:
+            return
+        if (time.monotonic() - self._last_state_save >= self.STATE_SAVE_INTERVAL
+                or received - self._events_at_state_save >= self.STATE_SAVE_EVENTS):
+            self._save_state()
+    
     def _get_log_file(self, category: AuditCategory) -> Path:
         """Get current log file for category."""
-        month_dir = self.subdirs[category] / datetime.now().strftime('%Y-%m')
-        month_dir.mkdir(parents=True, exist_ok=True)
+        if time.time() >= self._month_ends_at:
+            # New month (or first call): drop cached paths, recompute the boundary
+            now = datetime.now()
+            next_month = (now.replace(day=1) + timedelta(days=32)).replace(
+                day=1, hour=0, minute=0, second=0, microsecond=0
+            )
+            self._month_ends_at = next_month.timestamp()
+            self._month_cache = [None] * len(_CATEGORIES)
         
-        return month_dir / f"{category.value}.log"
+        log_file = self._month_cache[category.idx]
+        if log_file is None:
+            month_dir = self.subdirs[category.idx] / datetime.now().strftime('%Y-%m')
+            month_dir.mkdir(parents=True, exist_ok=True)
+            log_file = month_dir / f"{category.value}.log"
+            self._month_cache[category.idx] = log_file
+        
+        return log_file
     
     def log_task_lifecycle(self, event: TaskEvent, task_id: str, 
                            task_file: str = "", details: Optional[Dict] = None,
@@ -261,7 +602,7 @@ class AuditAgent:
                            agent_id: str = "system"):
         """Log task lifecycle event."""
         audit_event = TaskLifecycleEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp_ns=time.time_ns(),
             category=AuditCategory.TASK_LIFECYCLE.value,
             event=event.value,
             agent_id=agent_id,
@@ -274,7 +615,6 @@ class AuditAgent:
         )
         
         self._queue_event(audit_event)
-        self._update_daily_stats('task_lifecycle', event.value)
         
         logger.debug(f"Task lifecycle: {event.value} - {task_id}")
     
@@ -284,7 +624,7 @@ class AuditAgent:
                            details: Optional[Dict] = None):
         """Log agent decision event."""
         audit_event = AgentDecisionEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp_ns=time.time_ns(),
             category=AuditCategory.AGENT_DECISION.value,
             event=decision_type.value,
             agent_id=agent_id,
@@ -297,7 +637,6 @@ class AuditAgent:
         )
         
         self._queue_event(audit_event)
-        self._update_daily_stats('agent_decision', decision_type.value)
         
         logger.debug(f"Agent decision: {decision_type.value} by {agent_id}")
     
@@ -308,7 +647,7 @@ class AuditAgent:
         success = error is None
         
         audit_event = MCPCallEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp_ns=time.time_ns(),
             category=AuditCategory.MCP_CALL.value,
             event="mcp_call" if success else "mcp_error",
             agent_id=agent_id,
@@ -323,7 +662,6 @@ class AuditAgent:
         )
         
         self._queue_event(audit_event)
-        self._update_daily_stats('mcp_call', 'success' if success else 'error')
         self.stats['mcp_calls_logged'] = self.stats.get('mcp_calls_logged', 0) + 1
         
         if not success:
@@ -334,20 +672,19 @@ class AuditAgent:
                     stack_trace: Optional[str] = None):
         """Log failure event."""
         audit_event = FailureEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp_ns=time.time_ns(),
             category=AuditCategory.FAILURE.value,
             event="failure",
             agent_id=agent_id,
             error_type=error_type,
             error_message=error_message[:500],  # Truncate long messages
-            stack_trace=stack_trace,
+            stack_trace=_compress_stack(stack_trace) if stack_trace else stack_trace,
             context=context or {},
             severity=severity,
             session_id=self.session_id
         )
         
         self._queue_event(audit_event)
-        self._update_daily_stats('failure', severity)
         self.stats['failures_logged'] = self.stats.get('failures_logged', 0) + 1
         
         logger.error(f"Failure logged: {error_type} - {agent_id}")
@@ -357,7 +694,7 @@ class AuditAgent:
                   agent_id: str = "system"):
         """Log retry event."""
         audit_event = RetryEvent(
-            timestamp=datetime.now().isoformat(),
+            timestamp_ns=time.time_ns(),
             category=AuditCategory.RETRY.value,
             event="retry",
             agent_id=agent_id,
@@ -371,54 +708,97 @@ class AuditAgent:
         )
         
         self._queue_event(audit_event)
-        self._update_daily_stats('retry', outcome)
         self.stats['retries_logged'] = self.stats.get('retries_logged', 0) + 1
         
         logger.debug(f"Retry logged: {operation} attempt {attempt}/{max_attempts} - {outcome}")
     
     def _queue_event(self, event: AuditEvent):
         """Queue event for async processing."""
-        self.event_queue.put(event)
+        if len(self._events) >= self.MAX_QUEUED_EVENTS and not self._wait_for_space(event):
+            key = f"events_dropped_{event.category}"
+            self.stats[key] = self.stats.get(key, 0) + 1
+            return
+        
+        self._events.append(event)
+        if not self._wake.is_set():
+            self._wake.set()
         self.stats['events_received'] = self.stats.get('events_received', 0) + 1
     
+    def _wait_for_space(self, event: AuditEvent) -> bool:
+        """Block a producer until the queue has room. Returns False to drop the event."""
+        # Only critical categories wait, and only if a writer is draining
+        if event.category not in self.BLOCKING_CATEGORIES or not self.running:
+            return False
+        
+        self._wake.set()
+        with self._space:
+            self._waiting_producers += 1
+            try:
+                return self._space.wait_for(
+                    lambda: len(self._events) < self.MAX_QUEUED_EVENTS,
+                    timeout=self.BLOCK_TIMEOUT
+                )
+            finally:
+                self._waiting_producers -= 1
+    
     def _process_events(self):
         """Process queued events (writer thread)."""
-        while self.running:
+        while True:
             try:
-                # Collect events from queue
+                # Sleep until a producer signals, then drain what is queued.
+                # Clearing before draining means an append racing with the
+                # drain re-sets the event instead of being missed.
+                self._wake.wait(self.BATCH_TIMEOUT)
+                self._wake.clear()
+                
                 events = []
-                while not self.event_queue.empty() and len(events) < 100:
-                    try:
-                        event = self.event_queue.get_nowait()
-                        events.append(event)
-                    except queue.Empty:
-                        break
+                pending = self._events
+                
+                backlog = len(pending)
+                if backlog >= self.MAX_QUEUED_EVENTS * self.QUEUE_HIGH_WATERMARK:
+                    if not self._backlog_warned:
+                        logger.warning(f"Audit queue backlog high: {backlog}/{self.MAX_QUEUED_EVENTS} events")
+                        self._backlog_warned = True
+                elif self._backlog_warned:
+                    logger.info(f"Audit queue backlog recovered: {backlog} events")
+                    self._backlog_warned = False
                 
-                # Group by category
-                by_category: Dict[AuditCategory, List[AuditEvent]] = {
-                    cat: [] for cat in AuditCategory
-                }
+                while pending and len(events) < self.BATCH_MAX:
+                    events.append(pending.popleft())
+                if pending:
+                    self._wake.set()  # more than one batch queued
                 
+                if self._waiting_producers:
+                    with self._space:
+                        self._space.notify_all()
+                
+                if events:
+                    self._update_daily_stats(events)
+                
+                # Group by category into the reusable per-category buffers
+                buffers = self.buffers
                 for event in events:
-                    try:
-                        cat = AuditCategory(event.category)
-                        by_category[cat].append(event)
-                    except ValueError:
+                    index = _CATEGORY_INDEX.get(event.category)
+                    if index is None:
                         logger.warning(f"Unknown category: {event.category}")
+                        continue
+                    buffers[index].append(event)
                 
                 # Write to log files
-                for category, cat_events in by_category.items():
+                for category, cat_events in zip(_CATEGORIES, buffers):
                     if cat_events:
                         self._write_events(category, cat_events)
+                        cat_events.clear()
                 
                 # Generate daily summary if needed
                 self._maybe_generate_daily_summary()
                 
                 # Save state periodically
-                if self.stats['events_received'] % 100 == 0:
-                    self._save_state()
+                self._maybe_save_state()
                 
-                time.sleep(0.1)  # Small delay to prevent busy waiting
+                # Stopped and everything queued has been written
+                if not self.running and not self._events:
+                    return
                 
             except Exception as e:
                 logger.error(f"Error processing events: {e}")
@@ -429,32 +809,97 @@ class AuditAgent:
         log_file = self._get_log_file(category)
         
         try:
-            with open(log_file, 'a', encoding='utf-8') as f:
-                for event in events:
-                    f.write(event.to_json() + '\n')
+            # One pre-joined blob per batch -> a single write() syscall
+            blob = b''.join([event.to_json_bytes() + b'\n' for event in events])
+            
+            path, f = self._open_files.get(category, (None, None))
+            if path != log_file:
+                if f is not None:
+                    f.close()
+                    # Month rolled over: the previous file is complete
+                    self._schedule_maintenance()
+                f = open(log_file, 'ab', buffering=0)
+                self._open_files[category] = (log_file, f)
+            f.write(blob)
             
             self.stats['events_written'] = self.stats.get('events_written', 0) + len(events)
             
         except Exception as e:
             logger.error(f"Failed to write audit log: {e}")
+            # Drop the cached handle so the next batch reopens the file
+            self._close_log_file(category)
+    
+    def _close_log_file(self, category: AuditCategory):
+        """Close the cached append handle for a category, if any."""
+        _, f = self._open_files.pop(category, (None, None))
+        if f is not None:
+            try:
+                f.close()
+            except Exception as e:
+                logger.error(f"Failed to close audit log: {e}")
+    
+    def _schedule_maintenance(self):
+        """Run log rotation and retention pruning on the background thread."""
+        if self._maintenance_pool is None:
+            self._maintenance_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="audit-maint")
+        self._maintenance_pool.submit(self._maintain_logs)
+    
+    def _maintain_logs(self):
+        """Prune logs past retention and compress those of finished months."""
+        try:
+            self._prune_retention()
+            self._rotate_old_logs()
+        except Exception as e:
+            logger.error(f"Audit log maintenance failed: {e}")
     
-    def _update_daily_stats(self, category: str, event_type: str):
-        """Update daily statistics."""
+    def _rotate_old_logs(self):
+        """Compress every plain log file outside the current month."""
+        current_month = datetime.now().strftime('%Y-%m')
+        
+        for category, subdir in zip(_CATEGORIES, self.subdirs):
+            for month_dir in subdir.iterdir():
+                if not month_dir.is_dir() or month_dir.name >= current_month:
+                    continue
+                log_file = month_dir / f"{category.value}.log"
+                if log_file.exists():
+                    rotated = _compress_log(log_file)
+                    logger.info(f"Rotated audit log: {rotated.relative_to(self.audit_dir)}")
+    
+    def _prune_retention(self):
+        """Remove month directories that ended more than RETENTION days ago."""
+        today = datetime.now().date()
+        
+        for category, subdir in zip(_CATEGORIES, self.subdirs):
+            cutoff = today - timedelta(days=self.RETENTION[category])
+            for month_dir in subdir.iterdir():
+                try:
+                    month_start = datetime.strptime(month_dir.name, '%Y-%m').date()
+                except ValueError:
+                    continue
+                # First day of the following month
+                month_end = (month_start + timedelta(days=32)).replace(day=1)
+                if month_end <= cutoff:
+                    shutil.rmtree(month_dir)
+                    logger.info(f"Pruned audit logs past retention: {month_dir.relative_to(self.audit_dir)}")
+    
+    def _update_daily_stats(self, events: List[AuditEvent]):
+        """Update daily statistics for a batch of events (writer thread)."""
         today = datetime.now().strftime('%Y-%m-%d')
         
         if today not in self.daily_stats:
             self.daily_stats[today] = {
-                'task_lifecycle': {},
-                'agent_decision': {},
-                'mcp_call': {'success': 0, 'error': 0},
-                'failure': {'warning': 0, 'error': 0, 'critical': 0},
-                'retry': {'success': 0, 'failed': 0, 'pending': 0}
+                'task_lifecycle': Counter(),
+                'agent_decision': Counter(),
+                'mcp_call': Counter({'success': 0, 'error': 0}),
+                'failure': Counter({'warning': 0, 'error': 0, 'critical': 0}),
+                'retry': Counter({'success': 0, 'failed': 0, 'pending': 0})
             }
+        day = self.daily_stats[today]
         
-        if category in self.daily_stats[today]:
-            if event_type not in self.daily_stats[today][category]:
-                self.daily_stats[today][category][event_type] = 0
-            self.daily_stats[today][category][event_type] += 1
+        counts = Counter((event.category, event.stat_key()) for event in events)
+        for (category, event_type), count in counts.items():
+            if category in day:
+                day[category][event_type] += count
     
     def _maybe_generate_daily_summary(self):
         """Generate daily summary if day changed."""
@@ -573,34 +1018,71 @@ class AuditAgent:
         """Query audit events from log files."""
         events = []
         
-        current = start_date
-        while current <= end_date:
-            month_dir = self.subdirs[category] / current.strftime('%Y-%m')
+        # ISO 8601 strings of the same layout sort chronologically
+        start_key = start_date.isoformat()
+        end_key = end_date.isoformat()
+        start_raw = start_key.encode('utf-8')
+        end_raw = end_key.encode('utf-8')
+        
+        # With selective filters, only decode lines that contain the value
+        pattern = _filter_pattern(filters)
+        
+        # Each monthly file holds every day of that month, so read each once
+        year, month = start_date.year, start_date.month
+        while (year, month) <= (end_date.year, end_date.month):
+            month_dir = self.subdirs[category.idx] / f"{year:04d}-{month:02d}"
             log_file = month_dir / f"{category.value}.log"
             
-            if log_file.exists():
+            try:
+                f, compressed = _open_log_for_read(log_file)
+            except OSError as e:
+                logger.error(f"Failed to open log file: {e}")
+                f = None
+            
+            if f is not None:
                 try:
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        for line in f:
+                    with f:
+                        if pattern is None:
+                            lines = f
+                        elif compressed:
+                            lines = (line for line in f if pattern.search(line))
+                        else:
+                            lines = _matching_lines(f, pattern)
+                        
+                        for line in lines:
+                            # Range-check the raw timestamp before decoding
+                            ts = _line_timestamp(line)
+                            if ts is not None and not (start_raw <= ts <= end_raw):
+                                continue
+                            
                             try:
-                                event = json.loads(line.strip())
-                                
-                                # Apply filters
-                                if filters:
-                                    match = all(
-                                        event.get(k) == v 
-                                        for k, v in filters.items()
-                                    )
-                                    if not match:
-                                        continue
-                                
-                                events.append(event)
-                            except json.JSONDecodeError:
+                                event = _json_loads(line)
+                            except ValueError:
+                                continue
+                            
+                            if ts is None and not (start_key <= str(event.get('timestamp', '')) <= end_key):
                                 continue
+                            
+                            # Apply filters
+                            if filters:
+                                match = all(
+                                    event.get(k) == v 
+                                    for k, v in filters.items()
+                                )
+                                if not match:
+                                    continue
+                            
+                            stack_trace = event.get('stack_trace')
+                            if stack_trace and isinstance(stack_trace, str):
+                                event['stack_trace'] = _expand_stack(stack_trace)
+                            
+                            events.append(event)
                 except Exception as e:
                     logger.error(f"Failed to read log file: {e}")
             
-            current += timedelta(days=1)
+            month += 1
+            if month > 12:
+                year, month = year + 1, 1
         
         return events
     
@@ -618,8 +1100,15 @@ class AuditAgent:
             'by_category': {}
         }
         
-        for category in AuditCategory:
-            events = self.query_events(category, start_date, end_date)
+        # Categories live in separate files: read them concurrently
+        with ThreadPoolExecutor(max_workers=len(_CATEGORIES)) as pool:
+            futures = {
+                category: pool.submit(self.query_events, category, start_date, end_date)
+                for category in _CATEGORIES
+            }
+            results = {category: future.result() for category, future in futures.items()}
+        
+        for category, events in results.items():
             report['by_category'][category.value] = {
                 'count': len(events),
                 'recent': events[-10:] if events else []  # Last 10 events
@@ -630,9 +1119,14 @@ class AuditAgent:
             'failures': report['by_category'].get('failure', {}).get('count', 0),
             'retries': report['by_category'].get('retry', {}).get('count', 0),
             'mcp_errors': sum(
-                1 for e in self.query_events(AuditCategory.MCP_CALL, start_date, end_date)
+                1 for e in results[AuditCategory.MCP_CALL]
                 if not e.get('success', True)
-            )
+            ),
+            'events_dropped': {
+                key[len('events_dropped_'):]: count
+                for key, count in self.stats.items()
+                if key.startswith('events_dropped_')
+            }
         }
         
         return report
@@ -647,6 +1141,12 @@ class AuditAgent:
         self.writer_thread.daemon = True
         self.writer_thread.start()
         
+        # Catch up on rotation/retention missed while the agent was down
+        self._schedule_maintenance()
+        
+        # Persist stats even if the process exits without stop()
+        atexit.register(self._save_state)
+        
         logger.info("=" * 60)
         logger.info("Audit Agent started")
         logger.info(f"Audit directory: {self.audit_dir}")
@@ -661,6 +1161,21 @@ class AuditAgent:
     def stop(self):
         """Stop audit agent."""
         self.running = False
+        
+        # Wake the writer so it flushes what is queued and exits
+        self._wake.set()
+        if self.writer_thread is not None:
+            self.writer_thread.join(timeout=5)
+        
+        for category in list(self._open_files):
+            self._close_log_file(category)
+        
+        # Let an in-flight compression finish so no .tmp file is left behind
+        if self._maintenance_pool is not None:
+            self._maintenance_pool.shutdown(wait=True)
+            self._maintenance_pool = None
+        
+        atexit.unregister(self._save_state)
         self._save_state()
         logger.info("Audit Agent stopped")
     
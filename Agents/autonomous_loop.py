@@ -15,19 +15,88 @@ Behavior:
 7. Log outcome
 
 Loop Interval: 30 seconds
+
+Requirements:
+    pip install orjson  # optional, faster JSON parsing
+    pip install pyahocorasick  # optional, single-pass intent keyword scan
 """
 
 import os
 import sys
 import time
+import signal
+import asyncio
 import json
+import queue
+import shutil
+import itertools
+import sqlite3
+import threading
+import atexit
 import logging
+import logging.handlers
+from collections import Counter, OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any, List
-from dataclasses import dataclass, field, asdict
+from typing import Optional, Dict, Any, Iterable, Iterator, List, Mapping, Tuple
+from dataclasses import dataclass, field, fields
 from enum import Enum
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+def _json_loads(data: bytes) -> Any:
+    """Decode a JSON document, using orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj: Any, indent: bool = False) -> bytes:
+    """Encode a JSON document (compact or 2-space indented) as UTF-8."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(obj, indent=2).encode()
+    return json.dumps(obj, separators=(",", ":")).encode()
+
+
+def _fsync_dir(path: Path) -> None:
+    """Make a rename inside ``path`` durable (no-op where unsupported)."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return  # e.g. Windows, where directories cannot be opened
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def _iter_text(value: Any) -> Iterator[str]:
+    """Yield the keys and string values of a decoded JSON document."""
+    if isinstance(value, str):
+        yield value
+    elif isinstance(value, dict):
+        for key, item in value.items():
+            yield str(key)
+            yield from _iter_text(item)
+    elif isinstance(value, list):
+        for item in value:
+            yield from _iter_text(item)
+
 
 # =============================================================================
 # Configuration
@@ -40,6 +109,8 @@ class Config:
     LOOP_INTERVAL_SECONDS = 30
     MAX_RETRY_ATTEMPTS = 3
     RETRY_DELAY_SECONDS = 5
+    MAX_CONCURRENT_EVENTS = 8  # events in flight at once within a cycle
+    SKILL_WORKERS = 8  # threads running skill execution and verification
     
     # Paths
     BASE_DIR = Path(__file__).parent.parent
@@ -52,10 +123,12 @@ class Config:
     # Log files
     AUDIT_LOG = LOGS_DIR / "audit.log"
     LOOP_LOG = LOGS_DIR / "autonomous_loop.log"
+    MAX_LOG_BYTES = 10 * 1024 * 1024  # rotate logs past 10MB
     
     # State files
     STATE_FILE = BASE_DIR / ".agent_state.json"
-    PROCESSED_EVENTS_FILE = BASE_DIR / ".processed_events.json"
+    PROCESSED_EVENTS_DB = BASE_DIR / ".processed_events.db"
+    PROCESSED_EVENTS_FILE = BASE_DIR / ".processed_events.json"  # legacy, imported into the DB
     
     # Error handling
     MAX_CONSECUTIVE_ERRORS = 10
@@ -93,7 +166,12 @@ class EventStatus(Enum):
 # Data Classes
 # =============================================================================
 
-@dataclass
+# Slotted dataclasses (no per-instance __dict__) need Python 3.10+;
+# older interpreters fall back to regular instances.
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class Event:
     """Represents an incoming event to process."""
     event_id: str
@@ -128,7 +206,7 @@ class Event:
         )
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class Plan:
     """Represents an execution plan."""
     plan_id: str
@@ -142,14 +220,25 @@ class Plan:
     result: Optional[Dict[str, Any]] = None
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        # Shallow: actions/result are shared with the plan, not deep-copied
+        return {
+            "plan_id": self.plan_id,
+            "event_id": self.event_id,
+            "intent": self.intent,
+            "actions": self.actions,
+            "target_agent": self.target_agent,
+            "priority": self.priority,
+            "created_at": self.created_at,
+            "status": self.status,
+            "result": self.result
+        }
     
     @classmethod
     def from_dict(cls, data: Dict) -> "Plan":
         return cls(**data)
 
 
-@dataclass
+@dataclass(**_DATACLASS_SLOTS)
 class LoopMetrics:
     """Metrics for loop performance tracking."""
     cycles_completed: int = 0
@@ -165,7 +254,19 @@ class LoopMetrics:
     last_recovery: Optional[str] = None
     
     def to_dict(self) -> Dict:
-        return asdict(self)
+        return {
+            "cycles_completed": self.cycles_completed,
+            "events_processed": self.events_processed,
+            "events_failed": self.events_failed,
+            "plans_created": self.plans_created,
+            "retries_total": self.retries_total,
+            "consecutive_errors": self.consecutive_errors,
+            "last_cycle_time": self.last_cycle_time,
+            "avg_cycle_time": self.avg_cycle_time,
+            "uptime_seconds": self.uptime_seconds,
+            "last_error": self.last_error,
+            "last_recovery": self.last_recovery
+        }
 
 
 # =============================================================================
@@ -179,10 +280,15 @@ def setup_logging() -> logging.Logger:
     
     # Create logger
     logger = logging.getLogger("autonomous_loop")
+    if getattr(logger, "queue_listener", None) is not None:
+        return logger  # already configured
     logger.setLevel(logging.DEBUG)
     
-    # File handler
-    file_handler = logging.FileHandler(Config.LOOP_LOG)
+    # File handler; rolls over to a timestamped file once it is too large
+    file_handler = logging.handlers.RotatingFileHandler(
+        Config.LOOP_LOG, maxBytes=Config.MAX_LOG_BYTES, backupCount=1
+    )
+    file_handler.namer = lambda name: str(_rotated_log_name(Config.LOOP_LOG))
     file_handler.setLevel(logging.DEBUG)
     
     # Console handler
@@ -197,18 +303,73 @@ def setup_logging() -> logging.Logger:
     file_handler.setFormatter(formatter)
     console_handler.setFormatter(formatter)
     
-    logger.addHandler(file_handler)
-    logger.addHandler(console_handler)
+    # The loop only enqueues records; a background listener thread does the
+    # file/console I/O so logging never blocks a cycle on disk writes
+    log_queue: queue.Queue = queue.Queue(-1)
+    logger.addHandler(logging.handlers.QueueHandler(log_queue))
+    
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, console_handler, respect_handler_level=True
+    )
+    listener.start()
+    logger.queue_listener = listener
+    atexit.register(shutdown_logging, logger)
     
     return logger
 
 
+def _rotated_log_name(log_file: Path) -> Path:
+    """Unused timestamped name a log file can be rotated to."""
+    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+    rotated_file = log_file.with_suffix(f".{timestamp}.log")
+    n = 1
+    while rotated_file.exists():
+        rotated_file = log_file.with_suffix(f".{timestamp}_{n}.log")
+        n += 1
+    return rotated_file
+
+
+def shutdown_logging(logger: logging.Logger) -> None:
+    """Flush queued log records and stop the background listener."""
+    listener = getattr(logger, "queue_listener", None)
+    if listener is not None:
+        logger.queue_listener = None
+        listener.stop()
+
+
+# Whole second and its formatted string from the last _iso_now() call
+_TS_CACHE = [0, ""]
+
+
+def _iso_now() -> str:
+    """Current UTC time as YYYY-MM-DDTHH:MM:SSZ, formatted once per second."""
+    now = int(time.time())
+    if now != _TS_CACHE[0]:
+        _TS_CACHE[:] = [now, time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime(now))]
+    return _TS_CACHE[1]
+
+
 # =============================================================================
 # State Manager
 # =============================================================================
 
 class StateManager:
-    """Manages agent state persistence and recovery."""
+    """Manages agent state persistence and recovery.
+    
+    State lives in a JSON snapshot plus an append-only write-ahead log
+    (``STATE_FILE`` with a ``.wal`` suffix) holding one JSON line per
+    change. Mutations only append to the log; the snapshot is rewritten
+    and the log truncated every COMPACT_EVERY records and on close.
+    """
+    
+    # Minimum seconds between log flushes. Records appended in between
+    # stay in the file buffer until a later flush.
+    FLUSH_INTERVAL = 1.0
+    
+    # Log records written before the snapshot is compacted.
+    COMPACT_EVERY = 1000
+    
+    METRIC_FIELDS = frozenset(f.name for f in fields(LoopMetrics))
     
     def __init__(self, logger: logging.Logger):
         self.logger = logger
@@ -216,47 +377,187 @@ class StateManager:
             "loop_state": LoopState.IDLE.value,
             "started_at": None,
             "last_cycle": None,
-            "metrics": LoopMetrics().to_dict()
         }
+        # Live metrics; only turned into a dict when a snapshot is written
+        self.metrics = LoopMetrics()
+        self.wal_file = Config.STATE_FILE.with_suffix(".wal")
+        self._wal = None
+        self._wal_records = 0
+        self._dirty = False
+        self._batch_depth = 0
+        self._last_flush = 0.0
         self.load_state()
+        atexit.register(self.close)
     
     def load_state(self) -> None:
-        """Load state from file if exists."""
+        """Load the state snapshot, then replay the write-ahead log."""
         if Config.STATE_FILE.exists():
             try:
-                with open(Config.STATE_FILE, 'r') as f:
-                    saved_state = json.load(f)
+                with open(Config.STATE_FILE, 'rb') as f:
+                    saved_state = _json_loads(f.read())
+                    for key, value in saved_state.pop("metrics", {}).items():
+                        self._set_metric(key, value)
                     self.state.update(saved_state)
                     self.logger.info(f"State loaded from {Config.STATE_FILE}")
             except Exception as e:
                 self.logger.warning(f"Failed to load state: {e}")
+        
+        if self.wal_file.exists():
+            try:
+                good_bytes = 0
+                with open(self.wal_file, 'rb+') as f:
+                    for line in f:
+                        try:
+                            if not line.endswith(b"\n"):
+                                raise ValueError("incomplete record")
+                            record = _json_loads(line)
+                        except ValueError:
+                            # Torn final record from an interrupted write;
+                            # cut it off so later appends stay readable.
+                            f.truncate(good_bytes)
+                            break
+                        self._apply_record(record)
+                        self._wal_records += 1
+                        good_bytes += len(line)
+                if self._wal_records:
+                    self.logger.info(f"Replayed {self._wal_records} state log records")
+            except Exception as e:
+                self.logger.warning(f"Failed to replay state log: {e}")
+    
+    def _apply_record(self, record: Dict[str, Any]) -> None:
+        """Apply one write-ahead log record to the in-memory state."""
+        if record["op"] == "metric":
+            self._set_metric(record["k"], record["v"])
+        elif record["op"] == "merge":
+            # Several metrics changed together: {"k": "metrics", "v": {...}}
+            for key, value in record["v"].items():
+                self._set_metric(key, value)
+        else:
+            self.state[record["k"]] = record["v"]
     
     def save_state(self) -> None:
-        """Persist state to file."""
+        """Write a full state snapshot and truncate the write-ahead log.
+        
+        The snapshot is written to a temporary file, synced and renamed
+        over STATE_FILE, so a crash leaves either the old or the new
+        snapshot. The log is only truncated once the rename is durable.
+        """
         try:
             Config.STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(Config.STATE_FILE, 'w') as f:
-                json.dump(self.state, f, indent=2)
+            tmp_file = Config.STATE_FILE.with_suffix(".tmp")
+            with open(tmp_file, 'wb') as f:
+                f.write(_json_dumps(self._serialize_state(), indent=True))
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, Config.STATE_FILE)
+            _fsync_dir(Config.STATE_FILE.parent)
+            if self._wal is not None:
+                self._wal.flush()
+                self._wal.truncate(0)
+            elif self.wal_file.exists():
+                self.wal_file.unlink()
+            self._wal_records = 0
+            self._dirty = False
         except Exception as e:
             self.logger.error(f"Failed to save state: {e}")
+        self._last_flush = time.monotonic()
+    
+    def flush(self) -> None:
+        """Write buffered log records, compacting the log when it is long."""
+        if self._wal_records >= self.COMPACT_EVERY:
+            self.save_state()
+        elif self._dirty:
+            try:
+                self._wal.flush()
+                self._dirty = False
+            except Exception as e:
+                self.logger.error(f"Failed to flush state log: {e}")
+            self._last_flush = time.monotonic()
+    
+    def close(self) -> None:
+        """Compact pending changes into the snapshot and close the log."""
+        if self._wal_records:
+            self.save_state()
+        if self._wal is not None:
+            self._wal.close()
+            self._wal = None
+    
+    @contextmanager
+    def batched(self) -> Iterator["StateManager"]:
+        """Defer log flushes until the outermost block exits."""
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if not self._batch_depth:
+                self.flush()
+    
+    def _wal_append(self, op: str, key: str, value: Any) -> None:
+        """Append a change record, flushing once FLUSH_INTERVAL has passed.
+        
+        Records carry the resulting value rather than a delta so replaying
+        a log that was already folded into the snapshot is harmless.
+        """
+        try:
+            if self._wal is None:
+                self.wal_file.parent.mkdir(parents=True, exist_ok=True)
+                self._wal = open(self.wal_file, 'ab')
+            self._wal.write(_json_dumps({"op": op, "k": key, "v": value}) + b"\n")
+            self._wal_records += 1
+            self._dirty = True
+        except Exception as e:
+            self.logger.error(f"Failed to append state log: {e}")
+            return
+        if self._batch_depth:
+            return
+        if self._wal_records >= self.COMPACT_EVERY:
+            self.save_state()
+        elif time.monotonic() - self._last_flush >= self.FLUSH_INTERVAL:
+            self.flush()
     
     def update_state(self, key: str, value: Any) -> None:
         """Update state value and persist."""
         self.state[key] = value
-        self.save_state()
+        self._wal_append("set", key, value)
+    
+    def _serialize_state(self) -> Dict[str, Any]:
+        """State as written to the snapshot file."""
+        return {**self.state, "metrics": self.metrics.to_dict()}
+    
+    def _set_metric(self, key: str, value: Any) -> bool:
+        """Set a LoopMetrics field, ignoring unknown names."""
+        if key not in self.METRIC_FIELDS:
+            return False
+        setattr(self.metrics, key, value)
+        return True
     
     def update_metrics(self, **kwargs) -> None:
         """Update metrics values."""
-        for key, value in kwargs.items():
-            if key in self.state["metrics"]:
-                self.state["metrics"][key] = value
-        self.save_state()
+        changed = {key: value for key, value in kwargs.items() if self._set_metric(key, value)}
+        if changed:
+            self._wal_append("merge", "metrics", changed)
     
     def increment_metric(self, key: str, amount: int = 1) -> None:
         """Increment a metric value."""
-        if key in self.state["metrics"]:
-            self.state["metrics"][key] += amount
-            self.save_state()
+        if key in self.METRIC_FIELDS:
+            value = getattr(self.metrics, key) + amount
+            setattr(self.metrics, key, value)
+            self._wal_append("metric", key, value)
+    
+    def increment_metrics(self, **deltas: int) -> None:
+        """Increment several metrics, logged as a single state change."""
+        self.apply_deltas(deltas)
+    
+    def apply_deltas(self, deltas: Mapping[str, int]) -> None:
+        """Add a batch of metric deltas, logged as a single state change."""
+        changed = {}
+        for key, amount in deltas.items():
+            if key in self.METRIC_FIELDS:
+                changed[key] = getattr(self.metrics, key) + amount
+                setattr(self.metrics, key, changed[key])
+        if changed:
+            self._wal_append("merge", "metrics", changed)
     
     def get_state(self) -> str:
         """Get current loop state."""
@@ -265,62 +566,148 @@ class StateManager:
     def set_state(self, state: LoopState) -> None:
         """Set loop state."""
         self.state["loop_state"] = state.value
-        self.save_state()
+        self._wal_append("set", "loop_state", state.value)
         self.logger.info(f"State changed to: {state.value}")
     
     def get_metrics(self) -> LoopMetrics:
         """Get current metrics."""
-        return LoopMetrics(**self.state["metrics"])
+        return self.metrics
 
 
 # =============================================================================
 # Event Processor
 # =============================================================================
 
+class ProcessedEventStore:
+    """Set of processed event IDs kept in SQLite (WAL journal).
+    
+    Membership is answered by the database instead of an in-memory set,
+    so memory use and startup time stay flat however many events have
+    been processed. Safe to share between the inbox scan threads.
+    """
+    
+    # Bound parameters per IN (...) lookup (SQLite's default limit is 999)
+    QUERY_CHUNK = 900
+    
+    def __init__(self, path: Path):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        # WAL + synchronous=NORMAL: a commit appends to the WAL without an
+        # fsync; durability is settled at checkpoints
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS processed (id TEXT PRIMARY KEY) WITHOUT ROWID"
+        )
+        self._conn.commit()
+    
+    def __contains__(self, event_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM processed WHERE id = ?", (event_id,)
+            ).fetchone()
+        return row is not None
+    
+    def __len__(self) -> int:
+        with self._lock:
+            return self._conn.execute("SELECT COUNT(*) FROM processed").fetchone()[0]
+    
+    def add(self, event_id: str) -> None:
+        """Record one processed ID."""
+        with self._lock:
+            self._conn.execute("INSERT OR IGNORE INTO processed (id) VALUES (?)", (event_id,))
+            self._conn.commit()
+    
+    def update(self, event_ids: Iterable[str]) -> None:
+        """Record many processed IDs in one transaction."""
+        with self._lock:
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO processed (id) VALUES (?)",
+                ((event_id,) for event_id in event_ids)
+            )
+            self._conn.commit()
+    
+    def unprocessed(self, event_ids: List[str]) -> List[str]:
+        """Return the IDs not recorded yet, in their original order."""
+        if not event_ids:
+            return []
+        seen = set()
+        with self._lock:
+            for start in range(0, len(event_ids), self.QUERY_CHUNK):
+                chunk = event_ids[start:start + self.QUERY_CHUNK]
+                placeholders = ",".join("?" * len(chunk))
+                seen.update(row[0] for row in self._conn.execute(
+                    f"SELECT id FROM processed WHERE id IN ({placeholders})", chunk
+                ))
+        return [event_id for event_id in event_ids if event_id not in seen]
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+
 class EventProcessor:
     """Handles event detection and processing."""
     
+    CHANNELS = ("gmail", "whatsapp", "linkedin")
+    
+    # Directories modified more recently than this are rescanned every
+    # cycle (covers coarse mtime resolution on some filesystems).
+    LISTING_SETTLE_NS = 2_000_000_000
+    
     def __init__(self, logger: logging.Logger, state_manager: StateManager):
         self.logger = logger
         self.state_manager = state_manager
-        self.processed_events = self._load_processed_events()
+        self.processed_events = ProcessedEventStore(Config.PROCESSED_EVENTS_DB)
+        self._import_processed_events()
+        # Channel scans block on directory listing and file reads, which
+        # release the GIL, so the channels are scanned concurrently
+        self._scan_pool = ThreadPoolExecutor(
+            max_workers=len(self.CHANNELS), thread_name_prefix="inbox-scan"
+        )
+        atexit.register(self.close)
+        self._listings: Dict[str, Tuple[int, List[str]]] = {}
+        self._pending: Dict[str, Tuple[List[str], List[str]]] = {}
     
-    def _load_processed_events(self) -> set:
-        """Load set of processed event IDs."""
-        if Config.PROCESSED_EVENTS_FILE.exists():
-            try:
-                with open(Config.PROCESSED_EVENTS_FILE, 'r') as f:
-                    data = json.load(f)
-                    return set(data.get("processed", []))
-            except Exception as e:
-                self.logger.warning(f"Failed to load processed events: {e}")
-        return set()
+    def _import_processed_events(self) -> None:
+        """Move IDs from the old processed-events file into the database.
+        
+        Handles both earlier layouts: one ID per line, and a single JSON
+        document {"processed": [...]}. The file is removed once imported.
+        """
+        path = Config.PROCESSED_EVENTS_FILE
+        if not path.exists():
+            return
+        try:
+            data = path.read_bytes()
+            if data.startswith(b"{"):
+                event_ids = _json_loads(data).get("processed", [])
+            else:
+                # A torn final line is an incomplete ID; leave it out
+                event_ids = data[:data.rfind(b"\n") + 1].decode().splitlines()
+            self.processed_events.update(event_ids)
+            path.unlink()
+            self.logger.info(f"Imported {len(event_ids)} processed event IDs from {path}")
+        except Exception as e:
+            self.logger.warning(f"Failed to import processed events: {e}")
     
-    def _save_processed_events(self) -> None:
-        """Save processed events to file."""
+    def close(self) -> None:
+        """Stop the scan threads, then close the processed-ID store."""
+        self._scan_pool.shutdown(wait=True)
         try:
-            Config.PROCESSED_EVENTS_FILE.parent.mkdir(parents=True, exist_ok=True)
-            with open(Config.PROCESSED_EVENTS_FILE, 'w') as f:
-                json.dump({"processed": list(self.processed_events)}, f)
+            self.processed_events.close()
         except Exception as e:
-            self.logger.error(f"Failed to save processed events: {e}")
+            self.logger.error(f"Failed to close processed events store: {e}")
     
     def check_new_events(self) -> List[Event]:
         """Check for new events from all channels."""
         events = []
         
         try:
-            # Check Gmail inbox
-            gmail_events = self._check_gmail_inbox()
-            events.extend(gmail_events)
-            
-            # Check WhatsApp messages
-            whatsapp_events = self._check_whatsapp()
-            events.extend(whatsapp_events)
-            
-            # Check LinkedIn events
-            linkedin_events = self._check_linkedin()
-            events.extend(linkedin_events)
+            for channel_events in self._scan_pool.map(self._scan_channel, self.CHANNELS):
+                events.extend(channel_events)
             
             self.logger.debug(f"Found {len(events)} new events")
             
@@ -329,85 +716,74 @@ class EventProcessor:
         
         return events
     
-    def _check_gmail_inbox(self) -> List[Event]:
-        """Check Gmail inbox for new events."""
-        events = []
-        inbox_path = Config.INBOX_DIR / "gmail"
+    def _list_channel(self, channel: str) -> List[str]:
+        """Return the .json file names in a channel's inbox directory.
         
-        if inbox_path.exists():
-            for file in inbox_path.glob("*.json"):
-                event_id = file.stem
-                if event_id not in self.processed_events:
-                    try:
-                        with open(file, 'r') as f:
-                            data = json.load(f)
-                        event = Event(
-                            event_id=event_id,
-                            channel="gmail",
-                            timestamp=datetime.now().isoformat(),
-                            data=data
-                        )
-                        events.append(event)
-                        self.logger.debug(f"Found Gmail event: {event_id}")
-                    except Exception as e:
-                        self.logger.error(f"Error reading Gmail event {event_id}: {e}")
-        
-        return events
-    
-    def _check_whatsapp(self) -> List[Event]:
-        """Check WhatsApp for new events."""
-        events = []
-        whatsapp_path = Config.INBOX_DIR / "whatsapp"
+        The listing is reused while the directory mtime is unchanged, so a
+        quiet inbox costs one stat() per cycle instead of a full scan.
+        """
+        path = Config.INBOX_DIR / channel
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            self._listings.pop(channel, None)
+            return []
         
-        if whatsapp_path.exists():
-            for file in whatsapp_path.glob("*.json"):
-                event_id = file.stem
-                if event_id not in self.processed_events:
-                    try:
-                        with open(file, 'r') as f:
-                            data = json.load(f)
-                        event = Event(
-                            event_id=event_id,
-                            channel="whatsapp",
-                            timestamp=datetime.now().isoformat(),
-                            data=data
-                        )
-                        events.append(event)
-                        self.logger.debug(f"Found WhatsApp event: {event_id}")
-                    except Exception as e:
-                        self.logger.error(f"Error reading WhatsApp event {event_id}: {e}")
+        cached = self._listings.get(channel)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
         
-        return events
-    
-    def _check_linkedin(self) -> List[Event]:
-        """Check LinkedIn for new events."""
+        with os.scandir(path) as it:
+            names = [
+                entry.name for entry in it
+                if entry.name.endswith(".json") and entry.is_file()
+            ]
+        # A change landing within the filesystem's mtime granularity of
+        # this scan would leave the mtime unchanged, so only trust
+        # listings of directories that have been quiet for a while.
+        if time.time_ns() - mtime_ns > self.LISTING_SETTLE_NS:
+            self._listings[channel] = (mtime_ns, names)
+        return names
+    
+    def _scan_channel(self, channel: str) -> List[Event]:
+        """Collect unprocessed events from one channel's inbox."""
         events = []
-        linkedin_path = Config.INBOX_DIR / "linkedin"
+        path = Config.INBOX_DIR / channel
         
-        if linkedin_path.exists():
-            for file in linkedin_path.glob("*.json"):
-                event_id = file.stem
-                if event_id not in self.processed_events:
-                    try:
-                        with open(file, 'r') as f:
-                            data = json.load(f)
-                        event = Event(
-                            event_id=event_id,
-                            channel="linkedin",
-                            timestamp=datetime.now().isoformat(),
-                            data=data
-                        )
-                        events.append(event)
-                        self.logger.debug(f"Found LinkedIn event: {event_id}")
-                    except Exception as e:
-                        self.logger.error(f"Error reading LinkedIn event {event_id}: {e}")
+        names = self._list_channel(channel)
+        # IDs never leave the store, so while the listing is unchanged only
+        # the IDs still unprocessed last cycle need to be looked up again
+        cached = self._pending.get(channel)
+        if cached is not None and cached[0] is names:
+            event_ids = cached[1]
+        else:
+            event_ids = [name[:-5] for name in names]
+        event_ids = self.processed_events.unprocessed(event_ids)
+        self._pending[channel] = (names, event_ids)
+        
+        for event_id in event_ids:
+            try:
+                with open(path / f"{event_id}.json", 'rb') as f:
+                    data = _json_loads(f.read())
+                event = Event(
+                    event_id=event_id,
+                    channel=channel,
+                    timestamp=_iso_now(),
+                    data=data
+                )
+                events.append(event)
+                self.logger.debug(f"Found {channel} event: {event_id}")
+            except Exception as e:
+                self.logger.error(f"Error reading {channel} event {event_id}: {e}")
         
         return events
     
     def mark_event_processed(self, event_id: str) -> None:
         """Mark event as processed."""
-        self.processed_events.add(event_id)
-        self._save_processed_events()
+        try:
+            self.processed_events.add(event_id)
+        except Exception as e:
+            self.logger.error(f"Failed to save processed event {event_id}: {e}")
     
     def mark_event_failed(self, event: Event) -> bool:
         """Mark event as failed, return True if can retry."""
@@ -427,37 +803,119 @@ class EventProcessor:
 # Plan Generator
 # =============================================================================
 
+# Intent -> (target agent, actions, priority). Action dicts are shared by
+# every plan with that intent and must be treated as read-only.
+_INTENT_SPEC: Dict[str, Tuple[Optional[str], Tuple[Dict[str, Any], ...], str]] = {
+    "SPAM": (None, (
+        {"type": "archive", "reason": "spam_detected"},
+    ), "low"),
+    "SALES": ("sales_agent", (
+        {"type": "analyze", "focus": "lead_qualification"},
+        {"type": "respond", "tone": "professional"},
+        {"type": "create_task", "agent": "sales_agent"},
+    ), "high"),
+    "SUPPORT": ("support_agent", (
+        {"type": "analyze", "focus": "issue_classification"},
+        {"type": "respond", "tone": "empathetic"},
+        {"type": "create_ticket", "priority": "normal"},
+    ), "high"),
+    "BUSINESS": ("business_agent", (
+        {"type": "analyze", "focus": "opportunity_assessment"},
+        {"type": "escalate", "level": "management"},
+    ), "medium"),
+    "INTERNAL": ("internal_agent", (
+        {"type": "log", "action": "general_processing"},
+    ), "medium"),
+    "GENERAL": (None, (
+        {"type": "log", "action": "general_processing"},
+    ), "low"),
+}
+_DEFAULT_INTENT_SPEC = _INTENT_SPEC["GENERAL"]
+
+
+def _render_actions(actions: Iterable[Dict[str, Any]]) -> bytes:
+    """Render the numbered action list of a plan file."""
+    lines = []
+    for i, action in enumerate(actions, 1):
+        if 'focus' in action:
+            lines.append(f"{i}. {action['type']} ({action['focus']})\n")
+        else:
+            lines.append(f"{i}. {action['type']}\n")
+    return "".join(lines).encode()
+
+# Plan markdown: header, numbered actions, then status and footer
+_PLAN_HEADER_TEMPLATE = """# Plan: {plan_id}
+
+## Generated
+{created_at}
+
+## Source Event
+- **Channel**: {channel}
+- **Event ID**: {event_id}
+
+## Classification
+- **Intent**: {intent}
+- **Target Agent**: {target_agent}
+- **Priority**: {priority}
+
+## Actions
+"""
+_PLAN_STATUS_HEADING = b"""
+## Status
+"""
+_PLAN_FOOTER = b"""
+
+---
+*Auto-generated by Autonomous Loop Agent*
+"""
+
+# Action list markdown per intent, rendered once; plans only differ in
+# their header
+_PLAN_ACTIONS_MD = {
+    intent: _render_actions(actions) for intent, (_, actions, _) in _INTENT_SPEC.items()
+}
+
+
 class PlanGenerator:
     """Generates execution plans for events."""
     
+    # Intent keywords in precedence order
+    INTENT_KEYWORDS = (
+        ("SALES", ("buy", "price", "cost", "purchase", "demo")),
+        ("SUPPORT", ("help", "support", "issue", "problem", "bug")),
+        ("BUSINESS", ("partnership", "collaboration", "business")),
+        ("SPAM", ("spam", "promo", "unsubscribe")),
+    )
+    INTERNAL_DOMAIN = "@company.com"
+    
+    # Payload classifications remembered, least recently used evicted first
+    INTENT_CACHE_SIZE = 4096
+    
     def __init__(self, logger: logging.Logger, state_manager: StateManager):
         self.logger = logger
         self.state_manager = state_manager
+        self._intent_matcher = self._build_intent_matcher()
+        self._intent_cache: "OrderedDict[int, str]" = OrderedDict()
+        self._plan_seq = itertools.count(1)
     
     def create_plan(self, event: Event) -> Optional[Plan]:
         """Create execution plan for an event."""
         try:
-            # Generate plan ID
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            plan_id = f"PLAN_{timestamp}_{event.event_id[:8]}"
+            # Generate plan ID: epoch milliseconds plus a per-process
+            # sequence, unique even for many plans within one second
+            plan_id = f"PLAN_{time.time_ns() // 1_000_000:013d}_{next(self._plan_seq):06d}"
             
             # Analyze event and determine intent
             intent = self._classify_intent(event)
             
-            # Determine target agent based on intent
-            target_agent = self._get_target_agent(intent, event.channel)
-            
-            # Define actions
-            actions = self._define_actions(event, intent)
-            
-            # Determine priority
-            priority = self._determine_priority(event, intent)
+            # Target agent, actions and priority follow from the intent
+            target_agent, actions, priority = _INTENT_SPEC.get(intent, _DEFAULT_INTENT_SPEC)
             
             plan = Plan(
                 plan_id=plan_id,
                 event_id=event.event_id,
                 intent=intent,
-                actions=actions,
+                actions=list(actions),
                 target_agent=target_agent,
                 priority=priority,
                 created_at=datetime.now().isoformat()
@@ -476,107 +934,95 @@ class PlanGenerator:
             return None
     
     def _classify_intent(self, event: Event) -> str:
-        """Classify event intent."""
+        """Classify event intent, reusing the result for repeated payloads."""
+        # Retried events and replayed webhooks carry identical payloads.
+        # Key on a hash of the channel and the key-sorted JSON; without
+        # orjson that encoding costs about as much as classifying.
+        if orjson is None:
+            return self._match_intent(event)
+        try:
+            key = hash((event.channel, orjson.dumps(event.data, option=orjson.OPT_SORT_KEYS)))
+        except TypeError:
+            return self._match_intent(event)
+        
+        intent = self._intent_cache.get(key)
+        if intent is not None:
+            self._intent_cache.move_to_end(key)
+            return intent
+        
+        intent = self._match_intent(event)
+        self._intent_cache[key] = intent
+        if len(self._intent_cache) > self.INTENT_CACHE_SIZE:
+            self._intent_cache.popitem(last=False)
+        return intent
+    
+    def _match_intent(self, event: Event) -> str:
+        """Classify event intent from the keywords in its payload."""
         # Simple keyword-based classification
         # In production, this would use ML/NLP
         
-        data_str = json.dumps(event.data).lower()
+        text = "\x00".join(_iter_text(event.data)).lower()
         
-        if any(word in data_str for word in ["buy", "price", "cost", "purchase", "demo"]):
-            return "SALES"
-        elif any(word in data_str for word in ["help", "support", "issue", "problem", "bug"]):
-            return "SUPPORT"
-        elif any(word in data_str for word in ["partnership", "collaboration", "business"]):
-            return "BUSINESS"
-        elif any(word in data_str for word in ["spam", "promo", "unsubscribe"]):
-            return "SPAM"
-        elif event.channel == "gmail" and "@company.com" in data_str:
+        if self._intent_matcher is not None:
+            # One pass over the text; the earliest intent in
+            # INTENT_KEYWORDS wins when keywords of several intents occur.
+            best = None
+            for _, rank in self._intent_matcher.iter(text):
+                if best is None or rank < best:
+                    best = rank
+                    if not rank:
+                        break
+            if best is not None and best < len(self.INTENT_KEYWORDS):
+                return self.INTENT_KEYWORDS[best][0]
+            matched_internal = best is not None
+        else:
+            for intent, words in self.INTENT_KEYWORDS:
+                if any(word in text for word in words):
+                    return intent
+            matched_internal = self.INTERNAL_DOMAIN in text
+        
+        if event.channel == "gmail" and matched_internal:
             return "INTERNAL"
         
         return "GENERAL"
     
-    def _get_target_agent(self, intent: str, channel: str) -> Optional[str]:
-        """Determine target agent for intent."""
-        agent_mapping = {
-            "SALES": "sales_agent",
-            "SUPPORT": "support_agent",
-            "BUSINESS": "business_agent",
-            "INTERNAL": "internal_agent",
-            "SPAM": None,
-            "GENERAL": None
-        }
-        return agent_mapping.get(intent)
-    
-    def _define_actions(self, event: Event, intent: str) -> List[Dict[str, Any]]:
-        """Define actions for the plan."""
-        actions = []
+    def _build_intent_matcher(self) -> Optional[Any]:
+        """Build an Aho-Corasick automaton over all intent keywords.
         
-        if intent == "SPAM":
-            actions.append({"type": "archive", "reason": "spam_detected"})
-        elif intent == "SALES":
-            actions.append({"type": "analyze", "focus": "lead_qualification"})
-            actions.append({"type": "respond", "tone": "professional"})
-            actions.append({"type": "create_task", "agent": "sales_agent"})
-        elif intent == "SUPPORT":
-            actions.append({"type": "analyze", "focus": "issue_classification"})
-            actions.append({"type": "respond", "tone": "empathetic"})
-            actions.append({"type": "create_ticket", "priority": "normal"})
-        elif intent == "BUSINESS":
-            actions.append({"type": "analyze", "focus": "opportunity_assessment"})
-            actions.append({"type": "escalate", "level": "management"})
-        else:
-            actions.append({"type": "log", "action": "general_processing"})
-        
-        return actions
-    
-    def _determine_priority(self, event: Event, intent: str) -> str:
-        """Determine plan priority."""
-        if intent in ["SALES", "SUPPORT"]:
-            return "high"
-        elif intent == "BUSINESS":
-            return "medium"
-        elif intent == "INTERNAL":
-            return "medium"
-        else:
-            return "low"
+        Each keyword maps to its intent's rank in INTENT_KEYWORDS; the
+        internal domain ranks last. Returns None without pyahocorasick.
+        """
+        if ahocorasick is None:
+            return None
+        matcher = ahocorasick.Automaton()
+        for rank, (_, words) in enumerate(self.INTENT_KEYWORDS):
+            for word in words:
+                matcher.add_word(word, rank)
+        matcher.add_word(self.INTERNAL_DOMAIN, len(self.INTENT_KEYWORDS))
+        matcher.make_automaton()
+        return matcher
     
     def _save_plan(self, plan: Plan, event: Event) -> None:
         """Save plan to file."""
         Config.PLANS_DIR.mkdir(parents=True, exist_ok=True)
         
-        plan_content = f"""# Plan: {plan.plan_id}
-
-## Generated
-{plan.created_at}
-
-## Source Event
-- **Channel**: {event.channel}
-- **Event ID**: {event.event_id}
-
-## Classification
-- **Intent**: {plan.intent}
-- **Target Agent**: {plan.target_agent or "None (auto-process)"}
-- **Priority**: {plan.priority}
-
-## Actions
-"""
-        for i, action in enumerate(plan.actions, 1):
-            plan_content += f"{i}. {action['type']}"
-            if 'focus' in action:
-                plan_content += f" ({action['focus']})"
-            plan_content += "\n"
-        
-        plan_content += f"""
-## Status
-{plan.status}
-
----
-*Auto-generated by Autonomous Loop Agent*
-"""
+        buf = bytearray(_PLAN_HEADER_TEMPLATE.format(
+            plan_id=plan.plan_id,
+            created_at=plan.created_at,
+            channel=event.channel,
+            event_id=event.event_id,
+            intent=plan.intent,
+            target_agent=plan.target_agent or "None (auto-process)",
+            priority=plan.priority,
+        ).encode())
+        actions_md = _PLAN_ACTIONS_MD.get(plan.intent)
+        buf += actions_md if actions_md is not None else _render_actions(plan.actions)
+        buf += _PLAN_STATUS_HEADING
+        buf += plan.status.encode()
+        buf += _PLAN_FOOTER
         
         plan_file = Config.PLANS_DIR / f"{plan.plan_id}.md"
-        with open(plan_file, 'w') as f:
-            f.write(plan_content)
+        plan_file.write_bytes(buf)
 
 
 # =============================================================================
@@ -753,13 +1199,20 @@ class ResultVerifier:
 class AuditLogger:
     """Logs all decisions and actions to audit log."""
     
+    # Lines accumulate in this buffer and reach the file in one write
+    # when it fills or when flush() runs at the end of each loop cycle.
+    BUFFER_SIZE = 1 << 16
+    
     def __init__(self, logger: logging.Logger):
         self.logger = logger
+        self._fh = None
+        self._bytes_written = 0
         Config.LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        atexit.register(self.close)
     
     def log_decision(self, event: Event, plan: Optional[Plan]) -> None:
         """Log classification decision."""
-        timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+        timestamp = _iso_now()
         
         if plan:
             log_line = (
@@ -777,7 +1230,7 @@ class AuditLogger:
     
     def log_action(self, plan: Plan, result: Dict[str, Any]) -> None:
         """Log execution action."""
-        timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+        timestamp = _iso_now()
         status = "success" if result.get("success") else "failed"
         actions_count = len(result.get("actions_completed", []))
         
@@ -790,7 +1243,7 @@ class AuditLogger:
     
     def log_error(self, event: Event, error: str) -> None:
         """Log error."""
-        timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+        timestamp = _iso_now()
         
         log_line = (
             f"[{timestamp}] | ERROR | {event.channel} | {event.event_id} | "
@@ -801,7 +1254,7 @@ class AuditLogger:
     
     def log_recovery(self, recovery_type: str, details: str) -> None:
         """Log recovery action."""
-        timestamp = datetime.now().strftime("%Y-%m-%dT%H:%M:%SZ")
+        timestamp = _iso_now()
         
         log_line = (
             f"[{timestamp}] | RECOVERY | {recovery_type} | {details}\n"
@@ -812,10 +1265,82 @@ class AuditLogger:
     def _append_to_audit_log(self, log_line: str) -> None:
         """Append line to audit log."""
         try:
-            with open(Config.AUDIT_LOG, 'a') as f:
-                f.write(log_line)
+            if self._fh is None:
+                self._fh = open(Config.AUDIT_LOG, 'a', buffering=self.BUFFER_SIZE)
+                self._bytes_written = os.fstat(self._fh.fileno()).st_size
+            self._fh.write(log_line)
+            self._bytes_written += len(log_line)
+            if self._bytes_written >= Config.MAX_LOG_BYTES:
+                self._rotate_if_full()
         except Exception as e:
             self.logger.error(f"Failed to write audit log: {e}")
+    
+    def iter_entries(self) -> Iterator[bytes]:
+        """Yield each complete audit log line (without the newline).
+        
+        The file is streamed through a read buffer rather than loaded
+        whole, so scanning a large log keeps memory flat. A final line
+        still being written (no trailing newline) is skipped.
+        """
+        self.flush()
+        try:
+            f = open(Config.AUDIT_LOG, 'rb', buffering=self.BUFFER_SIZE)
+        except FileNotFoundError:
+            return
+        with f:
+            for line in f:
+                if line.endswith(b"\n"):
+                    yield line[:-1]
+    
+    def _rotate_if_full(self) -> None:
+        """Rotate the audit log once its on-disk size reaches MAX_LOG_BYTES.
+        
+        The running character count only approximates the size, so the
+        file is checked with fstat before it is renamed.
+        """
+        self._fh.flush()
+        size = os.fstat(self._fh.fileno()).st_size
+        if size < Config.MAX_LOG_BYTES:
+            self._bytes_written = size
+            return
+        
+        self._fh.close()
+        self._fh = None
+        self._bytes_written = 0
+        rotated_file = _rotated_log_name(Config.AUDIT_LOG)
+        try:
+            Config.AUDIT_LOG.rename(rotated_file)
+            self.logger.info(f"Rotated audit log to {rotated_file}")
+        except Exception as e:
+            self.logger.error(f"Failed to rotate audit log: {e}")
+    
+    def flush(self) -> None:
+        """Write buffered lines and reopen the log if it was rotated away."""
+        if self._fh is None:
+            return
+        try:
+            self._fh.flush()
+            try:
+                rotated = os.stat(Config.AUDIT_LOG).st_ino != os.fstat(self._fh.fileno()).st_ino
+            except FileNotFoundError:
+                rotated = True
+            if rotated:
+                self._fh.close()
+                self._fh = None
+        except Exception as e:
+            self.logger.error(f"Failed to flush audit log: {e}")
+    
+    def close(self) -> None:
+        """Flush, sync and close the audit log."""
+        if self._fh is None:
+            return
+        try:
+            self._fh.flush()
+            os.fsync(self._fh.fileno())
+            self._fh.close()
+        except Exception as e:
+            self.logger.error(f"Failed to close audit log: {e}")
+        self._fh = None
 
 
 # =============================================================================
@@ -825,10 +1350,16 @@ class AuditLogger:
 class RecoveryManager:
     """Handles self-recovery and graceful degradation."""
     
+    # Free space changes slowly; statvfs can stall on network filesystems,
+    # so it is sampled far less often than the other health checks.
+    DISK_CHECK_INTERVAL = Config.RECOVERY_CHECK_INTERVAL * 10
+    
     def __init__(self, logger: logging.Logger, state_manager: StateManager):
         self.logger = logger
         self.state_manager = state_manager
         self.last_recovery_check = time.time()
+        self._last_disk_check = None
+        self._last_disk_free = None
     
     def check_and_recover(self) -> bool:
         """Check system health and attempt recovery if needed."""
@@ -878,47 +1409,31 @@ class RecoveryManager:
     
     def _check_system_health(self) -> None:
         """Check system health metrics."""
-        # Check disk space
+        # Check disk space (log sizes are enforced by the log writers)
         self._check_disk_space()
-        
-        # Check log file sizes
-        self._check_log_sizes()
     
     def _check_disk_space(self) -> None:
         """Check available disk space."""
-        try:
-            import shutil
-            total, used, free = shutil.disk_usage(Config.BASE_DIR)
-            free_gb = free / (1024 ** 3)
-            
-            if free_gb < 1.0:  # Less than 1GB free
-                self.logger.warning(f"Low disk space: {free_gb:.2f}GB free")
-        except Exception as e:
-            self.logger.debug(f"Disk space check skipped: {e}")
-    
-    def _check_log_sizes(self) -> None:
-        """Check and rotate large log files."""
-        max_log_size = 10 * 1024 * 1024  # 10MB
-        
-        for log_file in Config.LOGS_DIR.glob("*.log"):
+        # Between samples the last reading is reused, so low space keeps
+        # being reported on every health check
+        now = time.monotonic()
+        if (self._last_disk_check is None
+                or now - self._last_disk_check >= self.DISK_CHECK_INTERVAL):
             try:
-                if log_file.stat().st_size > max_log_size:
-                    self.logger.info(f"Rotating large log file: {log_file}")
-                    self._rotate_log_file(log_file)
+                if hasattr(os, "statvfs"):
+                    st = os.statvfs(Config.BASE_DIR)
+                    free = st.f_bavail * st.f_frsize
+                else:
+                    free = shutil.disk_usage(Config.BASE_DIR).free
             except Exception as e:
-                self.logger.debug(f"Log size check failed for {log_file}: {e}")
-    
-    def _rotate_log_file(self, log_file: Path) -> None:
-        """Rotate a log file."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        rotated_file = log_file.with_suffix(f".{timestamp}.log")
+                self.logger.debug(f"Disk space check skipped: {e}")
+                return
+            self._last_disk_check = now
+            self._last_disk_free = free
         
-        try:
-            log_file.rename(rotated_file)
-            # Create new empty log file
-            log_file.touch()
-        except Exception as e:
-            self.logger.error(f"Failed to rotate log file: {e}")
+        free_gb = self._last_disk_free / (1024 ** 3)
+        if free_gb < 1.0:  # Less than 1GB free
+            self.logger.warning(f"Low disk space: {free_gb:.2f}GB free")
 
 
 # =============================================================================
@@ -940,9 +1455,18 @@ class AutonomousLoopAgent:
         
         self.running = False
         self.start_time = None
+        self._stop_requested: Optional[asyncio.Event] = None
+        self._event_sem: Optional[asyncio.Semaphore] = None
+        # Skill execution may block on agents, HTTP or subprocesses, so
+        # it runs on worker threads and concurrent events overlap
+        self._skill_pool = ThreadPoolExecutor(
+            max_workers=Config.SKILL_WORKERS, thread_name_prefix="skill"
+        )
+        # Metric increments made during a cycle, applied once at its end
+        self._metric_delta: "Counter[str]" = Counter()
     
-    def start(self) -> None:
-        """Start the autonomous loop."""
+    async def start(self) -> None:
+        """Start the autonomous loop (run with ``asyncio.run(agent.start())``)."""
         self.logger.info("=" * 60)
         self.logger.info("AUTONOMOUS LOOP AGENT STARTING")
         self.logger.info("=" * 60)
@@ -953,38 +1477,81 @@ class AutonomousLoopAgent:
         self.logger.info("=" * 60)
         
         self.running = True
-        self.start_time = time.time()
+        self.start_time = time.monotonic()
+        # Created here so they bind to the running loop (Python < 3.10)
+        self._stop_requested = asyncio.Event()
+        self._event_sem = asyncio.Semaphore(Config.MAX_CONCURRENT_EVENTS)
+        self._install_signal_handlers()
         self.state_manager.set_state(LoopState.RUNNING)
         self.state_manager.update_state("started_at", datetime.now().isoformat())
         
         try:
-            self._run_loop()
-        except KeyboardInterrupt:
+            await self._run_loop()
+        except (KeyboardInterrupt, asyncio.CancelledError):
             self.logger.info("Received shutdown signal")
         except Exception as e:
             self.logger.error(f"Fatal error in main loop: {e}")
         finally:
             self.stop()
     
+    def _install_signal_handlers(self) -> None:
+        """Stop the loop cleanly on SIGINT/SIGTERM."""
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            try:
+                loop.add_signal_handler(sig, self.request_stop)
+            except (NotImplementedError, RuntimeError):
+                # Windows event loops have no signal handlers; Ctrl+C
+                # still arrives as KeyboardInterrupt
+                pass
+    
+    def request_stop(self) -> None:
+        """Ask the loop to stop after the current step."""
+        if self.running:
+            self.logger.info("Received shutdown signal")
+        self.running = False
+        if self._stop_requested is not None:
+            self._stop_requested.set()
+    
+    async def _sleep(self, seconds: float) -> None:
+        """Sleep without blocking the event loop; wakes early on stop."""
+        try:
+            await asyncio.wait_for(self._stop_requested.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+    
     def stop(self) -> None:
         """Stop the autonomous loop."""
         self.running = False
         self.state_manager.set_state(LoopState.STOPPED)
         
+        self._apply_metric_delta()
+        
         # Calculate final uptime
         if self.start_time:
-            uptime = time.time() - self.start_time
+            uptime = time.monotonic() - self.start_time
             self.state_manager.update_metrics(uptime_seconds=uptime)
             self.logger.info(f"Total uptime: {uptime:.2f}s ({uptime/3600:.2f}h)")
         
+        if sys.version_info >= (3, 9):
+            self._skill_pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._skill_pool.shutdown(wait=False)
+        self.event_processor.close()
+        self.audit_logger.close()
+        self.state_manager.close()
         self.logger.info("Autonomous loop stopped")
+        shutdown_logging(self.logger)
     
-    def _run_loop(self) -> None:
+    async def _run_loop(self) -> None:
         """Main loop execution."""
         cycle_count = 0
+        # Cycles start on a fixed monotonic schedule, unaffected by
+        # wall-clock jumps and by how long each cycle's work takes
+        next_tick = time.monotonic() + Config.LOOP_INTERVAL_SECONDS
         
         while self.running:
-            cycle_start = time.time()
+            cycle_start = time.monotonic()
             cycle_count += 1
             
             try:
@@ -992,96 +1559,111 @@ class AutonomousLoopAgent:
                 if not self.recovery_manager.check_and_recover():
                     self.logger.error("Recovery failed, entering error state")
                     self.state_manager.set_state(LoopState.ERROR)
-                    time.sleep(Config.ERROR_COOLDOWN_SECONDS)
+                    await self._sleep(Config.ERROR_COOLDOWN_SECONDS)
                     continue
                 
-                # Step 2: Check for new events
-                events = self.event_processor.check_new_events()
+                # Step 2: Check for new events (directory scans and file
+                # reads run off the event loop)
+                events = await asyncio.get_running_loop().run_in_executor(
+                    None, self.event_processor.check_new_events
+                )
                 
                 if events:
-                    self.logger.info(f"Processing {len(events)} new events")
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info("Processing %d new events", len(events))
                     
-                    for event in events:
-                        self._process_event(event)
-                else:
+                    # Events run concurrently and are settled as each one
+                    # finishes; one failing event does not stop the batch
+                    with self.state_manager.batched():
+                        for next_done in asyncio.as_completed(
+                            [self._process_event_limited(event) for event in events]
+                        ):
+                            await next_done
+                elif self.logger.isEnabledFor(logging.DEBUG):
                     self.logger.debug("No new events to process")
                 
                 # Update metrics
-                self.state_manager.increment_metric("cycles_completed")
+                self._metric_delta["cycles_completed"] += 1
                 
             except Exception as e:
                 self.logger.error(f"Cycle error: {e}")
-                self.state_manager.increment_metric("consecutive_errors")
+                self._metric_delta["consecutive_errors"] += 1
                 
                 if Config.GRACEFUL_DEGRADATION_ENABLED:
                     self.logger.warning("Graceful degradation activated")
-                    time.sleep(Config.ERROR_COOLDOWN_SECONDS)
+                    await self._sleep(Config.ERROR_COOLDOWN_SECONDS)
                 else:
                     raise
             
             # Calculate cycle time
-            cycle_time = time.time() - cycle_start
+            cycle_time = time.monotonic() - cycle_start
+            self._apply_metric_delta()
             self.state_manager.update_metrics(
                 last_cycle_time=cycle_time,
                 consecutive_errors=0  # Reset on successful cycle
             )
+            self.audit_logger.flush()
+            self.state_manager.flush()
             
-            # Sleep until next cycle
-            sleep_time = max(0, Config.LOOP_INTERVAL_SECONDS - cycle_time)
+            # Sleep until next cycle; ticks a slow cycle overran are
+            # skipped rather than run back to back. The interval is read
+            # each cycle since graceful degradation lengthens it.
+            interval = Config.LOOP_INTERVAL_SECONDS
+            now = time.monotonic()
+            if next_tick <= now:
+                next_tick += (int((now - next_tick) // interval) + 1) * interval
+            sleep_time = next_tick - now
+            next_tick += interval
             if sleep_time > 0:
-                time.sleep(sleep_time)
+                await self._sleep(sleep_time)
     
-    def _process_event(self, event: Event) -> None:
-        """Process a single event through the full pipeline."""
-        self.logger.info(f"Processing event: {event.event_id} ({event.channel})")
+    def _apply_metric_delta(self) -> None:
+        """Apply the metric increments buffered since the last call."""
+        if self._metric_delta:
+            self.state_manager.apply_deltas(self._metric_delta)
+            self._metric_delta.clear()
+    
+    async def _process_event_limited(self, event: Event) -> None:
+        """Process an event once a MAX_CONCURRENT_EVENTS slot is free."""
+        async with self._event_sem:
+            try:
+                await self._process_event(event)
+            except Exception as e:
+                self.logger.error(f"Event {event.event_id} crashed: {e!r}")
+                self.audit_logger.log_error(event, repr(e))
+    
+    async def _process_event(self, event: Event) -> None:
+        """Process a single event, retrying failed attempts in place."""
+        # Per-event logging is skipped outright when the level is raised
+        if self.logger.isEnabledFor(logging.INFO):
+            self.logger.info("Processing event: %s (%s)", event.event_id, event.channel)
         
         try:
-            # Step 1: Mark as processing
-            event.status = EventStatus.PROCESSING
-            self.state_manager.increment_metric("events_processed")
-            
-            # Step 2: Analyze and create plan
-            plan = self.plan_generator.create_plan(event)
-            
-            if not plan:
-                self.logger.warning(f"Failed to create plan for {event.event_id}")
-                self.audit_logger.log_decision(event, None)
-                self.event_processor.mark_event_processed(event.event_id)
-                return
-            
-            # Log decision
-            self.audit_logger.log_decision(event, plan)
-            
-            # Step 3: Execute skills
-            result = self.skill_executor.execute_plan(plan, event)
-            
-            # Step 4: Verify result
-            verification_passed = self.result_verifier.verify_result(plan, result)
-            
-            # Log action
-            self.audit_logger.log_action(plan, result)
-            
-            # Step 5: Handle result
-            if verification_passed and result.get("success", False):
-                # Success - mark as completed
-                self.event_processor.mark_event_processed(event.event_id)
-                self.logger.info(f"Event {event.event_id} completed successfully")
-            else:
-                # Failed - check for retry
-                can_retry = self.event_processor.mark_event_failed(event)
+            for _ in range(Config.MAX_RETRY_ATTEMPTS):
+                outcome = await self._attempt(event)
+                if outcome is None:
+                    return
+                result, verification_passed = outcome
                 
-                if can_retry:
-                    # Will be retried in next cycle
-                    self.state_manager.increment_metric("retries_total")
-                    time.sleep(Config.RETRY_DELAY_SECONDS)
-                    self._process_event(event)  # Retry immediately
-                else:
+                if verification_passed and result.get("success", False):
+                    # Success - mark as completed
+                    self.event_processor.mark_event_processed(event.event_id)
+                    if self.logger.isEnabledFor(logging.INFO):
+                        self.logger.info("Event %s completed successfully", event.event_id)
+                    return
+                
+                # Failed - check for retry
+                if not self.event_processor.mark_event_failed(event):
                     # Max retries exceeded
                     self.audit_logger.log_error(
                         event, 
                         f"Max retries exceeded. Last error: {result.get('error', 'unknown')}"
                     )
-                    self.state_manager.increment_metric("events_failed")
+                    self._metric_delta["events_failed"] += 1
+                    return
+                
+                self._metric_delta["retries_total"] += 1
+                await asyncio.sleep(Config.RETRY_DELAY_SECONDS)
             
         except Exception as e:
             self.logger.error(f"Event processing error: {e}")
@@ -1090,9 +1672,48 @@ class AutonomousLoopAgent:
             # Attempt retry
             can_retry = self.event_processor.mark_event_failed(event)
             if can_retry:
-                self.state_manager.increment_metric("retries_total")
+                self._metric_delta["retries_total"] += 1
             else:
-                self.state_manager.increment_metric("events_failed")
+                self._metric_delta["events_failed"] += 1
+    
+    async def _attempt(self, event: Event) -> Optional[Tuple[Dict[str, Any], bool]]:
+        """
+        Run one plan/execute/verify pass over an event.
+        
+        Returns (result, verification_passed), or None when no plan could
+        be created and the event has been settled.
+        """
+        # Step 1: Mark as processing
+        event.status = EventStatus.PROCESSING
+        self._metric_delta["events_processed"] += 1
+        
+        # Step 2: Analyze and create plan
+        plan = self.plan_generator.create_plan(event)
+        
+        if not plan:
+            self.logger.warning(f"Failed to create plan for {event.event_id}")
+            self.audit_logger.log_decision(event, None)
+            self.event_processor.mark_event_processed(event.event_id)
+            return None
+        
+        # Log decision
+        self.audit_logger.log_decision(event, plan)
+        
+        # Steps 3 and 4: Execute skills and verify the result on the
+        # skill pool, in one hand-off
+        result, verification_passed = await asyncio.get_running_loop().run_in_executor(
+            self._skill_pool, self._execute_and_verify, plan, event
+        )
+        
+        # Log action
+        self.audit_logger.log_action(plan, result)
+        
+        return result, verification_passed
+    
+    def _execute_and_verify(self, plan: Plan, event: Event) -> Tuple[Dict[str, Any], bool]:
+        """Execute a plan and verify its result (runs on a skill worker)."""
+        result = self.skill_executor.execute_plan(plan, event)
+        return result, self.result_verifier.verify_result(plan, result)
 
 
 # =============================================================================
@@ -1108,7 +1729,7 @@ def main():
     
     # Create and start agent
     agent = AutonomousLoopAgent()
-    agent.start()
+    asyncio.run(agent.start())
 
 
 if __name__ == "__main__":